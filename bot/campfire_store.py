@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
-from bot.json_store import load_json, save_json
+from bot.json_store import load_json
+
+logger = logging.getLogger(__name__)
 
 
 def _default_data() -> Dict[str, Any]:
     return {"teams": {}}
 
 
-@dataclass
+@dataclass(slots=True)
 class CampfireState:
     fuel_points: int = 0
     is_camping: bool = False
@@ -20,11 +23,14 @@ class CampfireState:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CampfireState":
+        get = data.get
+        channel_id = get("channel_id")
+        started_at = get("started_at")
         return cls(
-            fuel_points=int(data.get("fuel_points", 0)),
-            is_camping=bool(data.get("is_camping", False)),
-            channel_id=int(data["channel_id"]) if data.get("channel_id") is not None else None,
-            started_at=float(data["started_at"]) if data.get("started_at") is not None else None,
+            fuel_points=int(get("fuel_points", 0)),
+            is_camping=bool(get("is_camping", False)),
+            channel_id=None if channel_id is None else int(channel_id),
+            started_at=None if started_at is None else float(started_at),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -39,15 +45,21 @@ class CampfireState:
 def load_campfire(path: Path) -> Dict[int, CampfireState]:
     raw = load_json(path, _default_data()) or _default_data()
     teams_raw = raw.get("teams") or {}
+    from_dict = CampfireState.from_dict
+    try:
+        return {int(role_id): from_dict(state_raw) for role_id, state_raw in teams_raw.items()}
+    except Exception:
+        pass
+    # Slow path: at least one entry is malformed, so parse them one by one and
+    # keep the rest.
     states: Dict[int, CampfireState] = {}
     for role_id, state_raw in teams_raw.items():
         try:
-            states[int(role_id)] = CampfireState.from_dict(state_raw)
+            states[int(role_id)] = from_dict(state_raw)
         except Exception:
-            continue
+            logger.warning("Skipping malformed campfire entry %r in %s", role_id, path)
     return states
 
 
-def save_campfire(path: Path, states: Dict[int, CampfireState]) -> None:
-    payload = {"teams": {str(role_id): state.to_dict() for role_id, state in states.items()}}
-    save_json(path, payload)
+def dump_campfire(states: Dict[int, CampfireState]) -> Dict[str, Any]:
+    return {"teams": {str(role_id): state.to_dict() for role_id, state in states.items()}}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+from typing import AbstractSet, FrozenSet, Iterable, Optional
 
 import discord
 from discord import app_commands
@@ -10,21 +10,29 @@ from discord.ext import commands
 logger = logging.getLogger(__name__)
 
 
-def _has_role(member: discord.Member, role_ids: Iterable[int]) -> bool:
-    expected_ids = {int(role_id) for role_id in role_ids}
-    return any(role.id in expected_ids for role in member.roles)
+def has_any_role(member: discord.Member, expected_ids: AbstractSet[int]) -> bool:
+    # Member.roles builds and sorts a fresh list on every access; get_role is a
+    # bisect over the member's role ids, so probe the (small) expected set instead.
+    return any(member.get_role(role_id) is not None for role_id in expected_ids)
+
+
+def _freeze_role_ids(role_ids: Iterable[int] | None) -> Optional[FrozenSet[int]]:
+    return frozenset(int(role_id) for role_id in role_ids) if role_ids else None
 
 
 def prefix_admin_check(role_ids: Iterable[int] | None = None) -> commands.Check:
+    explicit_role_ids = _freeze_role_ids(role_ids)
+
     def predicate(ctx: commands.Context) -> bool:
         if ctx.guild is None:
             raise commands.CheckFailure("This command can only be used in a server.")
         assert isinstance(ctx.author, discord.Member)
-        expected_role_ids = set(role_ids or getattr(getattr(ctx.bot, "config", None), "admin_role_ids", []))
+        bot_config = getattr(ctx.bot, "config", None)
+        expected_role_ids = explicit_role_ids or getattr(bot_config, "admin_role_ids", frozenset())
         if not expected_role_ids:
             raise commands.CheckFailure("Admin role not configured.")
-        if not _has_role(ctx.author, expected_role_ids):
-            mentions = ", ".join(f"<@&{role_id}>" for role_id in expected_role_ids)
+        if not has_any_role(ctx.author, expected_role_ids):
+            mentions = ", ".join(f"<@&{role_id}>" for role_id in sorted(expected_role_ids))
             raise commands.CheckFailure(f"You need one of these roles to run this command: {mentions}.")
         return True
 
@@ -32,16 +40,18 @@ def prefix_admin_check(role_ids: Iterable[int] | None = None) -> commands.Check:
 
 
 def app_command_admin_check(role_ids: Iterable[int] | None = None) -> app_commands.Check:
+    explicit_role_ids = _freeze_role_ids(role_ids)
+
     async def predicate(interaction: discord.Interaction) -> bool:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
             raise app_commands.CheckFailure("This command can only be used in a server.")
 
         bot_config = getattr(interaction.client, "config", None)
-        expected_role_ids = set(role_ids or getattr(bot_config, "admin_role_ids", []))
+        expected_role_ids = explicit_role_ids or getattr(bot_config, "admin_role_ids", frozenset())
         if not expected_role_ids:
             raise app_commands.CheckFailure("Admin role not configured.")
-        if not _has_role(interaction.user, expected_role_ids):
-            mentions = ", ".join(f"<@&{role_id}>" for role_id in expected_role_ids)
+        if not has_any_role(interaction.user, expected_role_ids):
+            mentions = ", ".join(f"<@&{role_id}>" for role_id in sorted(expected_role_ids))
             raise app_commands.CheckFailure(f"You need one of these roles to run this command: {mentions}.")
         return True
 
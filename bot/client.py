@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from discord.ext import commands
 
 from bot.checks import add_app_command_error_handler
 from bot.config import BotConfig
+from bot.counter_store import COUNTER_FILENAME
 from bot.ui import views as ui_views
 
 logger = logging.getLogger(__name__)
@@ -19,14 +21,22 @@ class BotClient(commands.Bot):
         super().__init__(command_prefix=config.prefix, intents=intents)
         self.config = config
         self.synced = False
+        # Shared by the counter commands and every ControlPanelView instance.
+        self.counter_path = config.data_dir / COUNTER_FILENAME
+        self.control_panel_view: ui_views.ControlPanelView | None = None
 
     @staticmethod
     def configure_intents() -> discord.Intents:
-        intents = discord.Intents.default()
+        # Only the gateway events the cogs consume; everything else (typing, reactions,
+        # voice states, emojis, invites, ...) would just be parsed and dropped.
+        intents = discord.Intents.none()
+        intents.guilds = True  # roles, channels and channel/thread delete events
+        intents.guild_messages = True  # prefix commands, teleport triggers, campfire replies
+        intents.dm_messages = True  # prefix commands such as !ping also work in DMs
         # Message content intent is required for prefix commands and must be enabled
         # in the Discord Developer Portal for your bot.
         intents.message_content = True
-        intents.members = True
+        intents.members = True  # role.members and guild.get_member in the countdown cog
         return intents
 
     async def setup_hook(self) -> None:
@@ -37,16 +47,14 @@ class BotClient(commands.Bot):
 
     async def _load_cogs(self) -> None:
         cogs_path = Path(__file__).parent / "cogs"
+        modules = [f"bot.cogs.{path.stem}" for path in cogs_path.glob("*.py") if not path.stem.startswith("__")]
+        results = await asyncio.gather(*(self.load_extension(module) for module in modules), return_exceptions=True)
         loaded: list[str] = []
-        for path in cogs_path.glob("*.py"):
-            if path.stem.startswith("__"):
-                continue
-            module = f"bot.cogs.{path.stem}"
-            try:
-                await self.load_extension(module)
+        for module, result in zip(modules, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to load cog %s", module, exc_info=result)
+            else:
                 loaded.append(module)
-            except Exception:
-                logger.exception("Failed to load cog %s", module)
         logger.info("Loaded %d cogs: %s", len(loaded), ", ".join(loaded))
 
     async def _sync_app_commands(self) -> None:
@@ -62,12 +70,11 @@ class BotClient(commands.Bot):
                 guild = discord.Object(id=self.config.dev_guild_id)
                 self.tree.copy_global_to(guild=guild)
                 commands_synced = await self.tree.sync(guild=guild)
-                self.synced = True
                 logger.info("Synced %d app commands to guild %s", len(commands_synced), guild.id)
             else:
                 commands_synced = await self.tree.sync()
-                self.synced = True
                 logger.info("Globally synced %d app commands; propagation may take time", len(commands_synced))
+            self.synced = True
         except discord.HTTPException:
             logger.exception(
                 "Failed to sync application commands. Make sure the bot was invited with the applications.commands scope."
@@ -4,19 +4,19 @@ import asyncio
 import logging
 import random
 import time
-from pathlib import Path
 from typing import Dict, Optional
 
 import discord
 from discord.ext import commands
 
-from bot.campfire_store import CampfireState, load_campfire, save_campfire
-from bot.economy_store import get_whitelisted_role_ids, load_economy, resolve_member_team_roles
+from bot.campfire_store import CampfireState, dump_campfire, load_campfire
+from bot.economy_store import fetch_whitelisted_role_ids, resolve_single_team_role
+from bot.json_store import DebouncedWriter
 
 logger = logging.getLogger(__name__)
 
 CAMP_COLOR = 0xE67E22
-BEAR_IMAGE_URLS = [
+BEAR_IMAGE_URLS = (
     "https://media.discordapp.net/attachments/1416695622374916178/1454542302386065540/image.png?ex=69517794&is=69502614&hm=f6b557b93f6977e9aadb22289d9c5501fbed82c847081efdc66ee689ec944229&=&format=webp&quality=lossless&width=1290&height=896",
     "https://media.discordapp.net/attachments/1416695622374916178/1454542410855088250/image.png?ex=695177ae&is=6950262e&hm=5ca33260a1bcf9173c33a9a7c8fb60ac4495e3e9b0ac3179e49e2f39c59bc43c&=&format=webp&quality=lossless&width=1230&height=861",
     "https://media.discordapp.net/attachments/1416695622374916178/1454542540425527296/image.png?ex=695177cd&is=6950264d&hm=6b0dcc1cd4ce00c9a88b1618cf3c7110d27f45f1aefda45ed40a41ff20727474&=&format=webp&quality=lossless&width=1272&height=1037",
@@ -24,8 +24,8 @@ BEAR_IMAGE_URLS = [
     "https://media.discordapp.net/attachments/1416695622374916178/1454542726702956554/image.png?ex=695177fa&is=6950267a&hm=691433c02e45f0a38527ca8d0411f1bec407c00ea66548e8082447312ced95ed&=&format=webp&quality=lossless&width=1130&height=921",
     "https://media.discordapp.net/attachments/1416695622374916178/1454542837101232280/image.png?ex=69517814&is=69502694&hm=19b491e7e41b840f00fc687fa13b04ff08a4f9ce2f4bd3581b22ff514665535e&=&format=webp&quality=lossless&width=581&height=1002",
     "https://media.discordapp.net/attachments/1416695622374916178/1454543277285048553/image.png?ex=6951787d&is=695026fd&hm=1cc289174955461858c039b7d22e37cba7b713d41c857f5bc0eccfb2c39c1be6&=&format=webp&quality=lossless&width=752&height=714",
-]
-BEAR_MESSAGES = [
+)
+BEAR_MESSAGES = (
     "# A bear is approaching!",
     "# It's coooomingggg...",
     "# You see a bear rushing towards you...",
@@ -35,21 +35,26 @@ BEAR_MESSAGES = [
     "# Say HI!!!",
     "# You are not alone in this forest...",
     "# I see you...",
-]
+)
 MERCY_SECONDS = 20 * 60
 MIN_BEAR_DELAY = 30
 MAX_BEAR_DELAY = 150
+SCARE_A_COUNT = 11
 
 
 class Campfire(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.campfire_path = Path(self.bot.config.data_dir) / "campfire.json"
-        self.economy_path = Path(self.bot.config.data_dir) / "economy.json"
-        self._lock = asyncio.Lock()
+        self.campfire_path = self.bot.config.data_dir / "campfire.json"
+        self.economy_path = self.bot.config.data_dir / "economy.json"
         self._states: Dict[int, CampfireState] = load_campfire(self.campfire_path)
         self._tasks: Dict[int, asyncio.Task[None]] = {}
         self._add_debounce: Dict[int, float] = {}
+        self._rng = random.Random()
+        self._writer = DebouncedWriter(self.campfire_path, lambda: dump_campfire(self._states))
+
+    async def cog_unload(self) -> None:
+        await self._writer.flush()
 
     def _error_embed(self, title: str, description: str, *, color: int = 0xE74C3C) -> discord.Embed:
         return discord.Embed(title=title, description=description, color=color)
@@ -63,12 +68,12 @@ class Campfire(commands.Cog):
         return embed
 
     def _resolve_member_team_role(
-        self, member: discord.Member, whitelisted_ids: set[int]
+        self, member: discord.Member, whitelisted_ids: frozenset[int]
     ) -> tuple[discord.Role | None, discord.Embed | None]:
-        matches = resolve_member_team_roles(member.roles, whitelisted_ids)
-        if len(matches) == 1:
-            return matches[0], None
-        if len(matches) == 0:
+        team_role, matches = resolve_single_team_role(member.roles, whitelisted_ids)
+        if team_role is not None:
+            return team_role, None
+        if not matches:
             embed = self._error_embed(
                 title=":no_entry: No team role found",
                 description="You don't have any whitelisted team roles. Please contact an admin to be added.",
@@ -83,9 +88,12 @@ class Campfire(commands.Cog):
         )
         return None, embed
 
-    def _load_whitelisted_role_ids(self) -> set[int]:
-        data = load_economy(self.economy_path)
-        return get_whitelisted_role_ids(data)
+    async def _load_whitelisted_role_ids(self) -> frozenset[int]:
+        # Prefer the Economy cog's in-memory whitelist; fall back to economy.json when it isn't loaded.
+        get_whitelist = getattr(self.bot.get_cog("Economy"), "get_whitelist", None)
+        if get_whitelist is not None:
+            return await get_whitelist()
+        return await fetch_whitelisted_role_ids(self.economy_path)
 
     def _get_state(self, team_role_id: int) -> CampfireState:
         state = self._states.get(team_role_id)
@@ -95,41 +103,50 @@ class Campfire(commands.Cog):
         return state
 
     def _persist(self) -> None:
-        save_campfire(self.campfire_path, self._states)
+        self._writer.mark_dirty()
 
-    def _schedule_bear_task(self, team_role: discord.Role, channel: discord.TextChannel, state: CampfireState) -> None:
-        task = self.bot.loop.create_task(self._bear_loop(team_role, channel, state))
+    def _schedule_bear_task(self, team_role: discord.Role, channel: discord.TextChannel, deadline: float) -> None:
+        task = self.bot.loop.create_task(self._bear_loop(team_role, channel, deadline))
         self._tasks[team_role.id] = task
         task.add_done_callback(lambda t, role_id=team_role.id: self._tasks.pop(role_id, None))
 
-    async def _bear_loop(self, team_role: discord.Role, channel: discord.TextChannel, state: CampfireState) -> None:
-        assert state.started_at is not None
-        cutoff = state.started_at + MERCY_SECONDS
+    async def _bear_loop(self, team_role: discord.Role, channel: discord.TextChannel, deadline: float) -> None:
+        # deadline is on the time.monotonic() clock so wall-clock jumps can't
+        # shorten or stretch the mercy window.
         while True:
-            now = time.time()
-            if now >= cutoff:
+            if time.monotonic() >= deadline:
                 break
-            delay = random.randint(MIN_BEAR_DELAY, MAX_BEAR_DELAY)
+            delay = self._rng.randint(MIN_BEAR_DELAY, MAX_BEAR_DELAY)
             await asyncio.sleep(delay)
-            if time.time() >= cutoff:
+            if time.monotonic() >= deadline:
                 break
             await self._trigger_bear_event(team_role, channel)
 
     async def _trigger_bear_event(self, team_role: discord.Role, channel: discord.TextChannel) -> None:
-        message_text = random.choice(BEAR_MESSAGES)
-        image_url = random.choice(BEAR_IMAGE_URLS)
+        message_text = self._rng.choice(BEAR_MESSAGES)
+        image_url = self._rng.choice(BEAR_IMAGE_URLS)
         try:
             await channel.send(content=message_text, embed=discord.Embed(color=CAMP_COLOR).set_image(url=image_url))
         except Exception:
             logger.exception("Failed to send bear event message")
             return
 
+        # Runs for every message the bot sees while waiting, so bind the
+        # constants it compares against as closure locals.
+        channel_id = channel.id
+        team_role_id = team_role.id
+        member_cls = discord.Member
+        threshold = SCARE_A_COUNT
+
         def check(msg: discord.Message) -> bool:
+            content = msg.content
+            if len(content) < threshold or msg.channel.id != channel_id:
+                return False
+            author = msg.author
             return (
-                msg.channel.id == channel.id
-                and isinstance(msg.author, discord.Member)
-                and any(role.id == team_role.id for role in msg.author.roles)
-                and msg.content.count("A") >= 11
+                isinstance(author, member_cls)
+                and author.get_role(team_role_id) is not None
+                and content.count("A") >= threshold
             )
 
         try:
@@ -147,12 +164,11 @@ class Campfire(commands.Cog):
             await self._apply_bear_damage(team_role, channel)
 
     async def _apply_bear_damage(self, team_role: discord.Role, channel: discord.TextChannel) -> None:
-        async with self._lock:
-            state = self._get_state(team_role.id)
-            damage = random.randint(5, 10)
-            state.fuel_points = max(0, state.fuel_points - damage)
-            self._persist()
-            fuel = state.fuel_points
+        state = self._get_state(team_role.id)
+        damage = self._rng.randint(5, 10)
+        state.fuel_points = max(0, state.fuel_points - damage)
+        self._persist()
+        fuel = state.fuel_points
 
         embed = discord.Embed(
             title=f"{team_role.name}'s Campfire",
@@ -181,20 +197,19 @@ class Campfire(commands.Cog):
     async def campfire(self, ctx: commands.Context) -> None:
         if not isinstance(ctx.author, discord.Member):
             return
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(ctx.author, whitelisted_ids)
         if team_role is None:
             await ctx.send(embed=error_embed)
             return
-        async with self._lock:
-            fuel = self._get_state(team_role.id).fuel_points
+        fuel = self._get_state(team_role.id).fuel_points
         await ctx.send(embed=self._camp_embed(team_role, fuel))
 
     @commands.command(name="add-firewood")
     async def add_firewood(self, ctx: commands.Context) -> None:
         if not isinstance(ctx.author, discord.Member):
             return
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(ctx.author, whitelisted_ids)
         if team_role is None:
             await ctx.send(embed=error_embed)
@@ -206,8 +221,7 @@ class Campfire(commands.Cog):
             return
         self._add_debounce[team_role.id] = now
 
-        async with self._lock:
-            total = self._add_firewood(team_role.id)
+        total = self._add_firewood(team_role.id)
 
         embed = self._camp_embed(team_role, total)
         await ctx.send(embed=embed)
@@ -218,41 +232,40 @@ class Campfire(commands.Cog):
     async def start_camping(self, ctx: commands.Context) -> None:
         if not isinstance(ctx.author, discord.Member):
             return
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(ctx.author, whitelisted_ids)
         if team_role is None:
             await ctx.send(embed=error_embed)
             return
-        async with self._lock:
-            state = self._get_state(team_role.id)
-            if state.is_camping:
-                await ctx.send(embed=self._error_embed("Already camping!", "Your campfire is already active.", color=CAMP_COLOR))
-                return
-            state.is_camping = True
-            state.channel_id = ctx.channel.id
-            state.started_at = time.time()
-            self._persist()
-        await ctx.send(embed=self._camp_embed(team_role, self._get_state(team_role.id).fuel_points))
-        self._schedule_bear_task(team_role, ctx.channel, self._get_state(team_role.id))
+        state = self._get_state(team_role.id)
+        if state.is_camping:
+            await ctx.send(embed=self._error_embed("Already camping!", "Your campfire is already active.", color=CAMP_COLOR))
+            return
+        state.is_camping = True
+        state.channel_id = ctx.channel.id
+        state.started_at = time.time()
+        self._persist()
+        fuel = state.fuel_points
+        await ctx.send(embed=self._camp_embed(team_role, fuel))
+        self._schedule_bear_task(team_role, ctx.channel, time.monotonic() + MERCY_SECONDS)
 
     @commands.command(name="stop-camping")
     async def stop_camping(self, ctx: commands.Context) -> None:
         if not isinstance(ctx.author, discord.Member):
             return
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(ctx.author, whitelisted_ids)
         if team_role is None:
             await ctx.send(embed=error_embed)
             return
-        async with self._lock:
-            state = self._get_state(team_role.id)
-            if not state.is_camping:
-                await ctx.send(embed=self._error_embed("Not currently camping.", "Start with !start-camping first.", color=CAMP_COLOR))
-                return
-            task = self._tasks.pop(team_role.id, None)
-            if task:
-                task.cancel()
-            self._stop_camping_state(team_role.id)
+        state = self._get_state(team_role.id)
+        if not state.is_camping:
+            await ctx.send(embed=self._error_embed("Not currently camping.", "Start with !start-camping first.", color=CAMP_COLOR))
+            return
+        task = self._tasks.pop(team_role.id, None)
+        if task:
+            task.cancel()
+        self._stop_camping_state(team_role.id)
         await ctx.send(embed=self._error_embed("Stopped camping!", "Your campfire is resting.", color=CAMP_COLOR))
 
 
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from pathlib import Path
 from random import randint
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.counter_store import COUNTER_FILENAME, increment_counter
+from bot.counter_store import flush_counters, increment_counter, load_counters
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,14 @@ class Core(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.counter_path = Path(self.bot.config.data_dir) / COUNTER_FILENAME
+        self.counter_path = bot.counter_path
+
+    async def cog_load(self) -> None:
+        # Read counters.json up front so the first /counter or panel click never waits on disk.
+        await asyncio.to_thread(load_counters, self.counter_path)
+
+    async def cog_unload(self) -> None:
+        await flush_counters()
 
     @commands.hybrid_command(name="ping", description="Check the bot's latency")
     async def ping(self, ctx: commands.Context) -> None:
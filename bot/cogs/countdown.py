@@ -1,37 +1,106 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
 import random
-import re
 import string
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.economy_store import get_whitelisted_role_ids, load_economy, resolve_member_team_roles
-from bot.json_store import load_json, save_json
+from bot.checks import has_any_role
+from bot.economy_store import fetch_whitelisted_role_ids, resolve_single_team_role
+from bot.json_store import DebouncedWriter, load_json
 
 logger = logging.getLogger(__name__)
 
 
 MAX_DURATION_SECONDS = 86_400
-ID_CHARSET = string.ascii_uppercase + string.digits
+ID_CHARSET = tuple(string.ascii_uppercase + string.digits)
 ID_LENGTH = 5
+DEAD_CHANNEL_CACHE_SIZE = 1024
+RESTORE_SEND_CONCURRENCY = 20
+THREAD_ADD_CONCURRENCY = 5
+TRAVEL_DEBOUNCE_SECONDS = 5
 EMBED_COLOR = 0xDCD6FF
 
-
-def _seconds_until_next_interval_boundary(now: datetime, interval_minutes: int) -> int:
-    """Return seconds until the next interval boundary from the provided aware datetime.
+# Static replies are built once and reused; discord.py serialises the embed on send.
+NO_TEAM_ROLE_EMBED = discord.Embed(
+    title=":no_entry: No team role found",
+    description="You don't have any whitelisted team roles. Please contact an admin to be added.",
+    color=0xE74C3C,
+)
+TRAVEL_NOT_FOUND_EMBED = discord.Embed(
+    title=":question: Countdown not found",
+    description="No active travel countdown found for your team role.",
+    color=0xF1C40F,
+)
+CANNOT_CANCEL_EMBED = discord.Embed(
+    title=":no_entry: Cannot cancel",
+    description="Travel cannot be changed after 3 minutes have passed.",
+    color=0xE74C3C,
+)
+INVALID_TARGET_EMBED = discord.Embed(
+    title=":no_entry: Invalid target",
+    description="Please provide either a user or a role, not both.",
+    color=0xE74C3C,
+)
+INVALID_DURATION_EMBED = discord.Embed(
+    title=":warning: Invalid duration",
+    description="Use a format like `1h30m`, `45m`, or `30s` (max 24h).",
+    color=0xE67E22,
+)
+DURATION_OUT_OF_RANGE_EMBED = discord.Embed(
+    title=":warning: Duration out of range",
+    description="Duration must be between 1 second and 24 hours (86400 seconds).",
+    color=0xE67E22,
+)
+GUILD_ONLY_EMBED = discord.Embed(
+    title=":no_entry: Guild only",
+    description="This command must be used in a server channel.",
+    color=0xE74C3C,
+)
+INVALID_INTERVAL_EMBED = discord.Embed(
+    title=":warning: Invalid interval",
+    description="Interval must be between 0 and 30 minutes.",
+    color=0xE67E22,
+)
+SLOW_DOWN_EMBED = discord.Embed(
+    title=":warning: Slow down",
+    description="You just did one — slow down.",
+    color=0xF1C40F,
+)
+MEMBERS_ONLY_EMBED = discord.Embed(
+    title=":no_entry: You don’t have permission",
+    description="This command can only be used in a server by members.",
+    color=0xE74C3C,
+)
+NOT_ADMIN_EMBED = discord.Embed(
+    title=":no_entry: You don’t have permission",
+    description="You need the configured admin role to cancel countdowns.",
+    color=0xE74C3C,
+)
+COUNTDOWN_NOT_FOUND_EMBED = discord.Embed(
+    title=":question: Countdown not found",
+    description="No countdown with that ID is active. Please double-check the ID.",
+    color=0xF1C40F,
+)
+
+
+def _seconds_until_next_interval_boundary(now_ts: int, interval_minutes: int) -> int:
+    """Return seconds until the next interval boundary (counted from UTC midnight) after ``now_ts``.
 
     Example:
-        >>> _seconds_until_next_interval_boundary(datetime(2024, 1, 1, 5, 27, tzinfo=timezone.utc), 15)
+        >>> _seconds_until_next_interval_boundary(1704086820, 15)  # 2024-01-01 05:27:00 UTC
         180
     """
 
@@ -39,40 +108,48 @@ def _seconds_until_next_interval_boundary(now: datetime, interval_minutes: int)
         return 0
 
     interval_seconds = interval_minutes * 60
-    seconds_today = now.hour * 3600 + now.minute * 60 + now.second
+    # Unix time has no leap seconds, so this is the second of the UTC day.
+    seconds_today = now_ts % 86_400
     remainder = seconds_today % interval_seconds
     if remainder == 0:
         return 0
     return interval_seconds - remainder
 
 
+# Seconds per unit indexed by byte value; 0 marks bytes that are not a unit.
+_UNIT_SECONDS = tuple({ord("h"): 3600, ord("m"): 60, ord("s"): 1}.get(byte, 0) for byte in range(256))
+
+
 def _parse_duration_seconds(duration: str) -> int:
-    cleaned = duration.replace(" ", "").lower()
-    pattern = re.compile(r"(\d+)([hms])")
-    position = 0
-    total_seconds = 0
+    """Parse ``<digits><h|m|s>`` segments, e.g. ``1h 30m``, into a number of seconds.
 
-    for match in pattern.finditer(cleaned):
-        start, end = match.span()
-        if start != position:
+    Raises ``ValueError`` on anything else, including non-ASCII input (``UnicodeEncodeError`` is a
+    ``ValueError``).
+    """
+    cleaned = duration.replace(" ", "").lower().encode("ascii")
+    total_seconds = 0
+    value = 0
+    has_digits = False
+
+    for byte in cleaned:
+        if 0x30 <= byte <= 0x39:
+            value = value * 10 + (byte - 0x30)
+            has_digits = True
+            continue
+        multiplier = _UNIT_SECONDS[byte]
+        if not multiplier or not has_digits:
             raise ValueError("Invalid duration format.")
-        value = int(match.group(1))
-        unit = match.group(2)
-        if unit == "h":
-            total_seconds += value * 3600
-        elif unit == "m":
-            total_seconds += value * 60
-        else:
-            total_seconds += value
-        position = end
+        total_seconds += value * multiplier
+        value = 0
+        has_digits = False
 
-    if position != len(cleaned) or total_seconds == 0:
+    if has_digits or total_seconds == 0:
         raise ValueError("Invalid duration format.")
 
     return total_seconds
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CountdownEntry:
     id: str
     guild_id: int
@@ -85,37 +162,53 @@ class CountdownEntry:
     ping_role_id: Optional[int] = None
     kind: str = "countdown"
     team_role_id: Optional[int] = None
+    # Frozen so the persisted form can be built once and reused by every later save of the
+    # active set; use dataclasses.replace() to derive a changed entry.
+    _serialized: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CountdownEntry":
+        get = data.get
+        start_ts = get("start_ts")
+        ping_user_id = get("ping_user_id")
+        ping_role_id = get("ping_role_id")
+        team_role_id = get("team_role_id")
         return cls(
             id=str(data["id"]).upper(),
             guild_id=int(data["guild_id"]),
             channel_id=int(data["channel_id"]),
             created_by_user_id=int(data["created_by_user_id"]),
             created_at_ts=int(data["created_at_ts"]),
-            start_ts=int(data["start_ts"]) if data.get("start_ts") is not None else None,
+            start_ts=None if start_ts is None else int(start_ts),
             end_ts=int(data["end_ts"]),
-            ping_user_id=int(data["ping_user_id"]) if data.get("ping_user_id") is not None else None,
-            ping_role_id=int(data["ping_role_id"]) if data.get("ping_role_id") is not None else None,
-            kind=data.get("kind", "countdown"),
-            team_role_id=int(data["team_role_id"]) if data.get("team_role_id") is not None else None,
+            ping_user_id=None if ping_user_id is None else int(ping_user_id),
+            ping_role_id=None if ping_role_id is None else int(ping_role_id),
+            kind=get("kind", "countdown"),
+            team_role_id=None if team_role_id is None else int(team_role_id),
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "guild_id": self.guild_id,
-            "channel_id": self.channel_id,
-            "created_by_user_id": self.created_by_user_id,
-            "created_at_ts": self.created_at_ts,
-            "start_ts": self.start_ts,
-            "end_ts": self.end_ts,
-            "ping_user_id": self.ping_user_id,
-            "ping_role_id": self.ping_role_id,
-            "kind": self.kind,
-            "team_role_id": self.team_role_id,
-        }
+        """Return the persisted form of this entry.
+
+        The dict is memoized and shared between saves, so treat it as read-only.
+        """
+        serialized = self._serialized
+        if serialized is None:
+            serialized = {
+                "id": self.id,
+                "guild_id": self.guild_id,
+                "channel_id": self.channel_id,
+                "created_by_user_id": self.created_by_user_id,
+                "created_at_ts": self.created_at_ts,
+                "start_ts": self.start_ts,
+                "end_ts": self.end_ts,
+                "ping_user_id": self.ping_user_id,
+                "ping_role_id": self.ping_role_id,
+                "kind": self.kind,
+                "team_role_id": self.team_role_id,
+            }
+            object.__setattr__(self, "_serialized", serialized)
+        return serialized
 
 
 class Countdown(commands.Cog):
@@ -123,82 +216,159 @@ class Countdown(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.countdowns_path = Path(self.bot.config.data_dir) / "countdowns.json"
-        self.economy_path = Path(self.bot.config.data_dir) / "economy.json"
-        self._lock = asyncio.Lock()
+        self.countdowns_path = self.bot.config.data_dir / "countdowns.json"
+        self.economy_path = self.bot.config.data_dir / "economy.json"
         self._active: Dict[str, CountdownEntry] = {}
-        self._tasks: Dict[str, asyncio.Task[None]] = {}
+        # Most recent active travel per team role, for /cancel_countdown recent.
+        self._latest_travel: Dict[int, CountdownEntry] = {}
+        # Pending completions as a min-heap of (deadline, seq, entry) with a single
+        # loop timer armed for the earliest one, instead of one sleeping task per
+        # countdown. Deadlines are on the loop's monotonic clock; end_ts stays the
+        # wall-clock value shown to users. Cancelled entries are left in place and
+        # skipped when due.
+        self._timers: list[tuple[float, int, CountdownEntry]] = []
+        self._timer_seq = itertools.count()
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
+        # Keyed by countdown id so /cancel can stop a completion that has already started.
+        self._completion_tasks: Dict[str, asyncio.Task[None]] = {}
         self._wait_tasks: Dict[str, asyncio.Task[None]] = {}
-        self._travel_debounce: Dict[tuple[int, int], float] = {}
+        # Last /travel per (guild, team), oldest first so expired entries can be
+        # dropped from the front.
+        self._travel_debounce: OrderedDict[tuple[int, int], float] = OrderedDict()
         self._interval_groups: Dict[tuple[int, int, int], Dict[str, object]] = {}
+        # Channels known to be deleted (insertion-ordered, capped), so completions
+        # for them skip the fetch_channel round-trip that would fail anyway.
+        self._dead_channels: Dict[int, None] = {}
+        self._writer = DebouncedWriter(
+            self.countdowns_path, lambda: [entry.to_dict() for entry in self._active.values()], delay=0.25
+        )
 
     async def cog_load(self) -> None:
         await self._load_existing_countdowns()
 
     async def cog_unload(self) -> None:
-        for task in list(self._tasks.values()):
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+        for task in list(self._completion_tasks.values()):
             task.cancel()
+        await self._writer.flush()
 
     async def _load_existing_countdowns(self) -> None:
-        stored = load_json(self.countdowns_path, [])
+        stored = await asyncio.to_thread(load_json, self.countdowns_path, [])
         now = time.time()
         active_entries: Dict[str, CountdownEntry] = {}
         to_schedule: list[CountdownEntry] = []
+        expired: list[CountdownEntry] = []
+        # Only rewrite the file if restoring actually dropped or migrated something.
+        changed = False
         logger.info("Restoring %d countdown(s) from storage", len(stored))
         for raw in stored:
             try:
                 entry = CountdownEntry.from_dict(raw)
             except Exception:
                 logger.exception("Failed to parse countdown entry: %s", raw)
+                changed = True
                 continue
 
             if entry.kind == "travel" and entry.team_role_id is None and entry.ping_role_id is not None:
-                entry.team_role_id = entry.ping_role_id
+                entry = replace(entry, team_role_id=entry.ping_role_id)
+                changed = True
 
             if entry.start_ts is None:
-                entry.start_ts = entry.created_at_ts
+                entry = replace(entry, start_ts=entry.created_at_ts)
+                changed = True
 
             if entry.end_ts <= now:
-                await self._send_completion(entry)
+                expired.append(entry)
+                changed = True
                 continue
 
             active_entries[entry.id] = entry
             to_schedule.append(entry)
 
-            if entry.kind == "travel" and entry.start_ts > now and entry.team_role_id is not None:
-                key = (entry.guild_id, entry.start_ts, entry.end_ts)
-                group = self._interval_groups.setdefault(
-                    key,
-                    {
-                        "team_role_ids": set(),
-                        "entry_ids": set(),
-                        "thread_id": None,
-                        "member_ids": set(),
-                        "created_at": time.time(),
-                    },
-                )
-                group["team_role_ids"].add(entry.team_role_id)
-                group["entry_ids"].add(entry.id)
-
-        async with self._lock:
-            self._active = active_entries
+            if entry.kind == "travel" and entry.start_ts > now:
+                self._register_interval_group(entry)
+
+        if len(active_entries) != len(stored):
+            changed = True
+
+        if expired:
+            # Announce countdowns that ended while the bot was offline concurrently,
+            # bounded so a long outage doesn't burst past Discord's rate limits.
+            semaphore = asyncio.Semaphore(RESTORE_SEND_CONCURRENCY)
+
+            async def send_bounded(entry: CountdownEntry) -> None:
+                async with semaphore:
+                    await self._send_completion(entry)
+
+            await asyncio.gather(*(send_bounded(entry) for entry in expired), return_exceptions=True)
+
+        self._active = active_entries
+        for entry in active_entries.values():
+            self._index_travel(entry)
+        if changed:
             self._persist()
 
-        for entry in to_schedule:
-            self._schedule_countdown(entry)
+        self._schedule_countdowns(to_schedule)
 
     def _persist(self) -> None:
-        save_json(self.countdowns_path, [entry.to_dict() for entry in self._active.values()])
+        self._writer.mark_dirty()
 
-    def _schedule_countdown(self, entry: CountdownEntry) -> None:
-        task = self.bot.loop.create_task(self._run_countdown(entry))
-        self._tasks[entry.id] = task
-        task.add_done_callback(lambda t, countdown_id=entry.id: self._tasks.pop(countdown_id, None))
+    def _deadline_for(self, entry: CountdownEntry, loop_now: float, wall_now: float) -> float:
+        return loop_now + max(0.0, entry.end_ts - wall_now)
 
-    def _cancel_wait_task(self, countdown_id: str) -> None:
-        wait_task = self._wait_tasks.pop(countdown_id, None)
-        if wait_task:
-            wait_task.cancel()
+    def _schedule_countdown(self, entry: CountdownEntry) -> None:
+        deadline = self._deadline_for(entry, self.bot.loop.time(), time.time())
+        heapq.heappush(self._timers, (deadline, next(self._timer_seq), entry))
+        if self._timers[0][2] is entry:
+            self._arm_timer()
+
+    def _schedule_countdowns(self, entries: list[CountdownEntry]) -> None:
+        # Bulk insert for restores: one O(n) heapify and a single timer arm instead
+        # of n pushes that may each re-arm the timer.
+        if not entries:
+            return
+        timers = self._timers
+        timer_seq = self._timer_seq
+        loop_now = self.bot.loop.time()
+        wall_now = time.time()
+        timers.extend((self._deadline_for(entry, loop_now, wall_now), next(timer_seq), entry) for entry in entries)
+        heapq.heapify(timers)
+        self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+        if not self._timers:
+            return
+        self._timer_handle = self.bot.loop.call_at(self._timers[0][0], self._fire_due_countdowns)
+
+    def _fire_due_countdowns(self) -> None:
+        self._timer_handle = None
+        timers = self._timers
+        now = self.bot.loop.time()
+        while timers and timers[0][0] <= now:
+            _, _, entry = heapq.heappop(timers)
+            if self._active.get(entry.id) is not entry:
+                continue
+            task = self.bot.loop.create_task(self._run_countdown(entry))
+            self._completion_tasks[entry.id] = task
+            task.add_done_callback(functools.partial(self._discard_task, self._completion_tasks, entry.id))
+        self._arm_timer()
+
+    def _cancel_tasks(self, countdown_id: str) -> None:
+        for tasks in (self._wait_tasks, self._completion_tasks):
+            task = tasks.pop(countdown_id, None)
+            if task:
+                task.cancel()
+
+    @staticmethod
+    def _discard_task(tasks: Dict[str, asyncio.Task[None]], countdown_id: str, task: asyncio.Task[None]) -> None:
+        # Done callback, so it also runs for tasks cancelled before they started.
+        if tasks.get(countdown_id) is task:
+            del tasks[countdown_id]
 
     async def _send_travel_start_after_wait(self, interaction: discord.Interaction, entry: CountdownEntry, wait_seconds: int, mention: str) -> None:
         try:
@@ -211,16 +381,9 @@ class Countdown(commands.Cog):
             await interaction.followup.send(embed=embed, content=mention)
         except Exception:
             logger.exception("Failed to send travel start notification for %s", entry.id)
-        finally:
-            self._wait_tasks.pop(entry.id, None)
 
     async def _run_countdown(self, entry: CountdownEntry) -> None:
         try:
-            delay = max(0.0, entry.end_ts - time.time())
-            await asyncio.sleep(delay)
-            async with self._lock:
-                if entry.id not in self._active:
-                    return
             await self._send_completion(entry)
             await self._cleanup_interval_group(entry, completed=True)
             await self._remove_entry(entry.id)
@@ -230,11 +393,40 @@ class Countdown(commands.Cog):
         except Exception:
             logger.exception("Error running countdown %s", entry.id)
 
+    def _get_entry_channel(self, entry: CountdownEntry) -> Optional[discord.abc.Messageable]:
+        # Client.get_channel scans every guild's channel map in turn; the entry
+        # already knows its guild, so resolve the channel through it directly.
+        guild = self.bot.get_guild(entry.guild_id)
+        if guild is not None:
+            return guild.get_channel_or_thread(entry.channel_id)
+        return self.bot.get_channel(entry.channel_id)
+
+    def _mark_channel_dead(self, channel_id: int) -> None:
+        dead = self._dead_channels
+        dead[channel_id] = None
+        if len(dead) > DEAD_CHANNEL_CACHE_SIZE:
+            del dead[next(iter(dead))]
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._mark_channel_dead(channel.id)
+
+    @commands.Cog.listener()
+    async def on_thread_delete(self, thread: discord.Thread) -> None:
+        self._mark_channel_dead(thread.id)
+
     async def _send_completion(self, entry: CountdownEntry) -> None:
-        channel = self.bot.get_channel(entry.channel_id)
+        channel = self._get_entry_channel(entry)
         if channel is None:
+            if entry.channel_id in self._dead_channels:
+                logger.warning("Channel %s for countdown %s was deleted", entry.channel_id, entry.id)
+                return
             try:
                 channel = await self.bot.fetch_channel(entry.channel_id)
+            except discord.NotFound:
+                self._mark_channel_dead(entry.channel_id)
+                logger.warning("Channel %s for countdown %s was deleted", entry.channel_id, entry.id)
+                return
             except Exception:
                 logger.warning("Unable to fetch channel %s for countdown %s", entry.channel_id, entry.id)
                 return
@@ -262,53 +454,93 @@ class Countdown(commands.Cog):
             logger.exception("Failed to send completion message for countdown %s", entry.id)
 
     async def _remove_entry(self, countdown_id: str) -> None:
-        async with self._lock:
-            self._active.pop(countdown_id, None)
+        entry = self._active.pop(countdown_id, None)
+        if entry is not None:
+            self._unindex_travel(entry)
             self._persist()
 
+    def _index_travel(self, entry: CountdownEntry) -> None:
+        if entry.kind != "travel" or entry.team_role_id is None:
+            return
+        latest = self._latest_travel.get(entry.team_role_id)
+        if latest is None or entry.created_at_ts > latest.created_at_ts:
+            self._latest_travel[entry.team_role_id] = entry
+
+    def _unindex_travel(self, entry: CountdownEntry) -> None:
+        if entry.team_role_id is None or self._latest_travel.get(entry.team_role_id) is not entry:
+            return
+        # The team's latest travel went away; fall back to its next most recent one.
+        del self._latest_travel[entry.team_role_id]
+        for candidate in self._active.values():
+            if candidate.team_role_id == entry.team_role_id:
+                self._index_travel(candidate)
+
     def _generate_unique_id(self) -> str:
-        existing_ids = set(self._active.keys()) | set(self._tasks.keys())
+        active = self._active
         while True:
-            candidate = "".join(random.choice(ID_CHARSET) for _ in range(ID_LENGTH))
-            if candidate not in existing_ids:
+            candidate = "".join(random.choices(ID_CHARSET, k=ID_LENGTH))
+            if candidate not in active:
                 return candidate
 
+    def _record_travel(self, key: tuple[int, int], now_monotonic: float) -> None:
+        debounce = self._travel_debounce
+        debounce[key] = now_monotonic
+        debounce.move_to_end(key)
+        while debounce:
+            oldest_key, oldest = next(iter(debounce.items()))
+            if now_monotonic - oldest < TRAVEL_DEBOUNCE_SECONDS:
+                break
+            del debounce[oldest_key]
+
+    @staticmethod
+    def _interval_key(entry: CountdownEntry) -> tuple[int, int, int]:
+        assert entry.start_ts is not None
+        return (entry.guild_id, entry.start_ts, entry.end_ts)
+
     def _register_interval_group(self, entry: CountdownEntry) -> None:
         if entry.start_ts is None or entry.team_role_id is None:
             return
-        key = (entry.guild_id, entry.start_ts, entry.end_ts)
-        group = self._interval_groups.setdefault(
-            key,
-            {
+        key = self._interval_key(entry)
+        group = self._interval_groups.get(key)
+        if group is None:
+            group = self._interval_groups[key] = {
                 "team_role_ids": set(),
                 "entry_ids": set(),
                 "thread_id": None,
                 "member_ids": set(),
                 "created_at": time.time(),
-            },
-        )
+            }
         group["team_role_ids"].add(entry.team_role_id)
         group["entry_ids"].add(entry.id)
 
+    def _release_interval_thread(self, key: tuple[int, int, int]) -> None:
+        # Thread creation failed: clear the claim so a later start can retry it.
+        group = self._interval_groups.get(key)
+        if group is not None and group.get("thread_id") == "pending":
+            group["thread_id"] = None
+
     async def _ensure_interval_thread(self, entry: CountdownEntry) -> Optional[int]:
         if entry.start_ts is None:
             return None
-        key = (entry.guild_id, entry.start_ts, entry.end_ts)
-        async with self._lock:
-            group = self._interval_groups.get(key)
-            if not group:
-                return None
-            if group.get("thread_id") not in (None, "pending"):
-                return group["thread_id"]  # type: ignore[return-value]
-            team_role_ids: set[int] = group["team_role_ids"]  # type: ignore[assignment]
-            if len(team_role_ids) < 2:
-                return None
-            if group.get("thread_id") == "pending":
-                return None
-            group["thread_id"] = "pending"
+        # Claiming the group and recording the thread are each plain synchronous
+        # sections, so other coroutines can't interleave with them; "pending"
+        # marks that one caller is already creating the thread.
+        key = self._interval_key(entry)
+        group = self._interval_groups.get(key)
+        if not group:
+            return None
+        thread_id = group.get("thread_id")
+        if thread_id == "pending":
+            return None
+        if thread_id is not None:
+            return thread_id  # type: ignore[return-value]
+        if len(group["team_role_ids"]) < 2:  # type: ignore[arg-type]
+            return None
+        group["thread_id"] = "pending"
 
         guild = self.bot.get_guild(entry.guild_id)
         if guild is None:
+            self._release_interval_thread(key)
             return None
 
         channel = self.bot.get_channel(1450520738485506059)
@@ -317,6 +549,7 @@ class Countdown(commands.Cog):
                 channel = await self.bot.fetch_channel(1450520738485506059)
             except Exception:
                 logger.exception("Failed to fetch transit thread channel")
+                self._release_interval_thread(key)
                 return None
 
         start_dt = datetime.fromtimestamp(entry.start_ts, tz=timezone.utc)
@@ -331,30 +564,35 @@ class Countdown(commands.Cog):
             )
         except Exception:
             logger.exception("Failed to create transit thread")
-            async with self._lock:
-                if key in self._interval_groups:
-                    self._interval_groups[key]["thread_id"] = None
+            self._release_interval_thread(key)
             return None
 
-        async with self._lock:
-            group = self._interval_groups.get(key)
-            if not group:
-                return thread.id
-            group["thread_id"] = thread.id
-            team_role_ids = group["team_role_ids"]  # type: ignore[assignment]
-            member_ids = group["member_ids"]  # type: ignore[assignment]
+        group = self._interval_groups.get(key)
+        if not group:
+            return thread.id
+        group["thread_id"] = thread.id
+        team_role_ids: set[int] = group["team_role_ids"]  # type: ignore[assignment]
+        member_ids: set[int] = group["member_ids"]  # type: ignore[assignment]
 
         mentions = []
+        members: list[discord.Member] = []
         for role_id in team_role_ids:
             role = guild.get_role(role_id)
             if role:
                 mentions.append(role.mention)
-                for member in role.members:
-                    try:
-                        await thread.add_user(member)
-                        member_ids.add(member.id)
-                    except Exception:
-                        logger.warning("Failed adding member %s to transit thread", member.id)
+                members.extend(role.members)
+
+        semaphore = asyncio.Semaphore(THREAD_ADD_CONCURRENCY)
+
+        async def add_member(member: discord.Member) -> None:
+            async with semaphore:
+                try:
+                    await thread.add_user(member)
+                    member_ids.add(member.id)
+                except Exception:
+                    logger.warning("Failed adding member %s to transit thread", member.id)
+
+        await asyncio.gather(*(add_member(member) for member in members))
 
         body = "You are alone on this travel." if len(team_role_ids) == 1 else "\n".join(mentions)
         aboard_embed = discord.Embed(
@@ -386,27 +624,23 @@ class Countdown(commands.Cog):
         return embed
 
     def _has_admin_role(self, member: discord.Member) -> bool:
-        expected_roles = getattr(self.bot.config, "admin_role_ids", [])
-        expected_ids = {int(role_id) for role_id in expected_roles}
-        return bool(expected_ids) and any(role.id in expected_ids for role in member.roles)
+        return has_any_role(member, self.bot.config.admin_role_ids)
 
-    def _load_whitelisted_role_ids(self) -> set[int]:
-        data = load_economy(self.economy_path)
-        return get_whitelisted_role_ids(data)
+    async def _load_whitelisted_role_ids(self) -> frozenset[int]:
+        # Prefer the Economy cog's in-memory whitelist; fall back to economy.json when it isn't loaded.
+        get_whitelist = getattr(self.bot.get_cog("Economy"), "get_whitelist", None)
+        if get_whitelist is not None:
+            return await get_whitelist()
+        return await fetch_whitelisted_role_ids(self.economy_path)
 
     def _resolve_member_team_role(
-        self, member: discord.Member, whitelisted_ids: set[int]
+        self, member: discord.Member, whitelisted_ids: frozenset[int]
     ) -> tuple[discord.Role | None, discord.Embed | None]:
-        matches = resolve_member_team_roles(member.roles, whitelisted_ids)
-        if len(matches) == 1:
-            return matches[0], None
-        if len(matches) == 0:
-            embed = self._permission_embed(
-                title=":no_entry: No team role found",
-                description="You don't have any whitelisted team roles. Please contact an admin to be added.",
-                color=0xE74C3C,
-            )
-            return None, embed
+        team_role, matches = resolve_single_team_role(member.roles, whitelisted_ids)
+        if team_role is not None:
+            return team_role, None
+        if not matches:
+            return None, NO_TEAM_ROLE_EMBED
         embed = self._permission_embed(
             title=":warning: Multiple team roles detected",
             description="You have multiple whitelisted team roles: "
@@ -428,7 +662,7 @@ class Countdown(commands.Cog):
     async def _cleanup_interval_group(self, entry: CountdownEntry, *, completed: bool) -> None:
         if entry.start_ts is None or entry.kind != "travel":
             return
-        key = (entry.guild_id, entry.start_ts, entry.end_ts)
+        key = self._interval_key(entry)
         group = self._interval_groups.get(key)
         if not group:
             return
@@ -456,17 +690,10 @@ class Countdown(commands.Cog):
             self._interval_groups.pop(key, None)
 
     def _find_recent_travel_for_team(self, team_role_id: int) -> Optional[CountdownEntry]:
-        candidates = [
-            entry
-            for entry in self._active.values()
-            if entry.kind == "travel" and entry.team_role_id == team_role_id
-        ]
-        if not candidates:
-            return None
-        return max(candidates, key=lambda e: e.created_at_ts)
+        return self._latest_travel.get(team_role_id)
 
     async def _cancel_recent_travel(self, interaction: discord.Interaction) -> None:
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(interaction.user, whitelisted_ids)
         if team_role is None and error_embed is not None:
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
@@ -475,20 +702,12 @@ class Countdown(commands.Cog):
         assert team_role is not None
         entry = self._find_recent_travel_for_team(team_role.id)
         if entry is None:
-            embed = self._permission_embed(
-                title=":question: Countdown not found",
-                description="No active travel countdown found for your team role.",
-                color=0xF1C40F,
-            )
+            embed = TRAVEL_NOT_FOUND_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         if time.time() - entry.created_at_ts > 180:
-            embed = self._permission_embed(
-                title=":no_entry: Cannot cancel",
-                description="Travel cannot be changed after 3 minutes have passed.",
-                color=0xE74C3C,
-            )
+            embed = CANNOT_CANCEL_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
@@ -502,14 +721,12 @@ class Countdown(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
     async def _cancel_entry(self, entry: CountdownEntry) -> None:
-        async with self._lock:
-            self._active.pop(entry.id, None)
+        if self._active.pop(entry.id, None) is not None:
+            self._unindex_travel(entry)
             self._persist()
 
-        self._cancel_wait_task(entry.id)
-        task = self._tasks.pop(entry.id, None)
-        if task:
-            task.cancel()
+        self._cancel_tasks(entry.id)
+        logger.info("Countdown %s cancelled before completion", entry.id)
         await self._cleanup_interval_group(entry, completed=False)
 
     @app_commands.command(name="countdown", description="Start a countdown")
@@ -531,31 +748,19 @@ class Countdown(commands.Cog):
             return
 
         if ping_user and ping_role:
-            embed = self._permission_embed(
-                title=":no_entry: Invalid target",
-                description="Please provide either a user or a role, not both.",
-                color=0xE74C3C,
-            )
+            embed = INVALID_TARGET_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         try:
             duration_seconds = _parse_duration_seconds(duration)
         except ValueError:
-            embed = self._permission_embed(
-                title=":warning: Invalid duration",
-                description="Use a format like `1h30m`, `45m`, or `30s` (max 24h).",
-                color=0xE67E22,
-            )
+            embed = INVALID_DURATION_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         if duration_seconds <= 0 or duration_seconds > MAX_DURATION_SECONDS:
-            embed = self._permission_embed(
-                title=":warning: Duration out of range",
-                description="Duration must be between 1 second and 24 hours (86400 seconds).",
-                color=0xE67E22,
-            )
+            embed = DURATION_OUT_OF_RANGE_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
@@ -573,9 +778,8 @@ class Countdown(commands.Cog):
             kind="countdown",
         )
 
-        async with self._lock:
-            self._active[entry.id] = entry
-            self._persist()
+        self._active[entry.id] = entry
+        self._persist()
         self._schedule_countdown(entry)
 
         embed = self._build_started_embed(entry)
@@ -587,60 +791,44 @@ class Countdown(commands.Cog):
     async def travel(self, interaction: discord.Interaction, duration: str, interval: int | None = 0) -> None:
         if interaction.channel is None or interaction.guild is None or not isinstance(interaction.user, discord.Member):
             await interaction.response.send_message(
-                embed=self._permission_embed(
-                    title=":no_entry: Guild only",
-                    description="This command must be used in a server channel.",
-                    color=0xE74C3C,
-                ),
+                embed=GUILD_ONLY_EMBED,
                 ephemeral=True,
             )
             return
 
         interval_value = int(interval or 0)
         if interval_value < 0 or interval_value > 30:
-            embed = self._permission_embed(
-                title=":warning: Invalid interval",
-                description="Interval must be between 0 and 30 minutes.",
-                color=0xE67E22,
-            )
+            embed = INVALID_INTERVAL_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         try:
             duration_seconds = _parse_duration_seconds(duration)
         except ValueError:
-            embed = self._permission_embed(
-                title=":warning: Invalid duration",
-                description="Use a format like `1h30m`, `45m`, or `30s` (max 24h).",
-                color=0xE67E22,
-            )
+            embed = INVALID_DURATION_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
         if duration_seconds <= 0 or duration_seconds > MAX_DURATION_SECONDS:
-            embed = self._permission_embed(
-                title=":warning: Duration out of range",
-                description="Duration must be between 1 second and 24 hours (86400 seconds).",
-                color=0xE67E22,
-            )
+            embed = DURATION_OUT_OF_RANGE_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(interaction.user, whitelisted_ids)
         if team_role is None and error_embed is not None:
             await interaction.response.send_message(embed=error_embed, ephemeral=True)
             return
 
-        now = datetime.now(timezone.utc)
-        wait_seconds = _seconds_until_next_interval_boundary(now, interval_value)
-        start_ts = int(now.timestamp()) + wait_seconds
+        now_ts = int(time.time())
+        wait_seconds = _seconds_until_next_interval_boundary(now_ts, interval_value)
+        start_ts = now_ts + wait_seconds
         entry = CountdownEntry(
             id=self._generate_unique_id(),
             guild_id=interaction.guild.id,
             channel_id=interaction.channel.id,
             created_by_user_id=interaction.user.id,
-            created_at_ts=int(time.time()),
+            created_at_ts=now_ts,
             start_ts=start_ts,
             end_ts=start_ts + duration_seconds,
             ping_role_id=team_role.id,
@@ -648,27 +836,18 @@ class Countdown(commands.Cog):
             team_role_id=team_role.id,
         )
 
-        debounce_embed: discord.Embed | None = None
         now_monotonic = time.monotonic()
-        async with self._lock:
-            key = (interaction.guild.id, team_role.id)
-            last = self._travel_debounce.get(key)
-            if last is not None and now_monotonic - last < 5:
-                debounce_embed = self._permission_embed(
-                    title=":warning: Slow down",
-                    description="You just did one — slow down.",
-                    color=0xF1C40F,
-                )
-            else:
-                self._travel_debounce[key] = now_monotonic
-                self._active[entry.id] = entry
-                self._persist()
-                if wait_seconds > 0:
-                    self._register_interval_group(entry)
-
-        if debounce_embed is not None:
-            await interaction.response.send_message(embed=debounce_embed, ephemeral=True)
+        key = (interaction.guild.id, team_role.id)
+        last = self._travel_debounce.get(key)
+        if last is not None and now_monotonic - last < TRAVEL_DEBOUNCE_SECONDS:
+            await interaction.response.send_message(embed=SLOW_DOWN_EMBED, ephemeral=True)
             return
+        self._record_travel(key, now_monotonic)
+        self._active[entry.id] = entry
+        self._index_travel(entry)
+        self._persist()
+        if wait_seconds > 0:
+            self._register_interval_group(entry)
 
         self._schedule_countdown(entry)
 
@@ -686,7 +865,7 @@ class Countdown(commands.Cog):
                 self._send_travel_start_after_wait(interaction, entry, wait_seconds, mention)
             )
             self._wait_tasks[entry.id] = wait_task
-            wait_task.add_done_callback(lambda t, countdown_id=entry.id: self._wait_tasks.pop(countdown_id, None))
+            wait_task.add_done_callback(functools.partial(self._discard_task, self._wait_tasks, entry.id))
         else:
             embed_color = self._travel_color(interaction.guild.id, team_role.id)
             embed = self._build_started_embed(entry, color=embed_color)
@@ -698,11 +877,7 @@ class Countdown(commands.Cog):
     async def cancel_countdown(self, interaction: discord.Interaction, id: str) -> None:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
             await interaction.response.send_message(
-                embed=self._permission_embed(
-                    title=":no_entry: You don’t have permission",
-                    description="This command can only be used in a server by members.",
-                    color=0xE74C3C,
-                ),
+                embed=MEMBERS_ONLY_EMBED,
                 ephemeral=True,
             )
             return
@@ -714,22 +889,14 @@ class Countdown(commands.Cog):
 
         if not self._has_admin_role(interaction.user):
             await interaction.response.send_message(
-                embed=self._permission_embed(
-                    title=":no_entry: You don’t have permission",
-                    description="You need the configured admin role to cancel countdowns.",
-                    color=0xE74C3C,
-                ),
+                embed=NOT_ADMIN_EMBED,
                 ephemeral=True,
             )
             return
 
         entry = self._active.get(normalized.upper())
         if entry is None:
-            embed = self._permission_embed(
-                title=":question: Countdown not found",
-                description="No countdown with that ID is active. Please double-check the ID.",
-                color=0xF1C40F,
-            )
+            embed = COUNTDOWN_NOT_FOUND_EMBED
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
@@ -1,27 +1,115 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import heapq
 import logging
-from pathlib import Path
+import time
+import weakref
+from operator import itemgetter
+from typing import AbstractSet, AsyncIterator
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot.checks import has_any_role
 from bot.economy_store import (
     EconomyData,
     add_whitelisted_role,
     get_balance,
     get_whitelisted_role_ids,
-    load_economy,
+    load_economy_stamped,
     remove_whitelisted_role,
-    resolve_member_team_roles,
-    save_economy,
+    resolve_single_team_role,
     set_balance,
+    transfer_balance,
 )
+from bot.json_store import DebouncedWriter, file_stamp
 
 logger = logging.getLogger(__name__)
 
+BALANCE_KEY = itemgetter(1)
+LEADERBOARD_CACHE_SECONDS = 30
+
+# Static replies are built once and reused; discord.py serialises the embed on send.
+GUILD_ONLY_EMBED = discord.Embed(
+    title=":no_entry: Guild only",
+    description="This command can only be used inside a server.",
+    color=0xE74C3C,
+)
+NOT_ADMIN_EMBED = discord.Embed(
+    title=":no_entry: You don't have permission",
+    description="You need an admin role to do that.",
+    color=0xE74C3C,
+)
+SERVER_ONLY_EMBED = discord.Embed(
+    title=":no_entry: Guild only",
+    description="This command must be used inside a server.",
+    color=0xE74C3C,
+)
+NOT_ADMIN_OTHER_TEAMS_EMBED = discord.Embed(
+    title=":no_entry: You don't have permission",
+    description="You need an admin role to view other teams.",
+    color=0xE74C3C,
+)
+NOT_INVOKER_EMBED = discord.Embed(
+    title=":no_entry: Not allowed",
+    description="Only the command invoker can use these buttons.",
+    color=0xE74C3C,
+)
+NO_TEAM_ROLE_EMBED = discord.Embed(
+    title=":no_entry: No team role found",
+    description="You don't have any whitelisted team roles. Please contact an admin to be added.",
+    color=0xE74C3C,
+)
+NO_WHITELISTED_ROLES_EMBED = discord.Embed(
+    title=":information_source: No whitelisted roles",
+    description="No team roles have been whitelisted yet.",
+    color=0x3498DB,
+)
+INVALID_TRANSFER_AMOUNT_EMBED = discord.Embed(
+    title=":warning: Invalid amount",
+    description="Please provide a positive amount to transfer.",
+    color=0xF1C40F,
+)
+INSUFFICIENT_TRANSFER_FUNDS_EMBED = discord.Embed(
+    title=":no_entry: Insufficient funds",
+    description="Your team role does not have enough funds for this transfer.",
+    color=0xE74C3C,
+)
+INSUFFICIENT_REMOVE_FUNDS_EMBED = discord.Embed(
+    title=":no_entry: Insufficient funds",
+    description="Insufficient funds to remove that amount.",
+    color=0xE74C3C,
+)
+_NON_NEGATIVE_AMOUNT_EMBED = discord.Embed(
+    title=":warning: Invalid amount",
+    description="Amount must be greater than or equal to zero.",
+    color=0xF1C40F,
+)
+INVALID_AMOUNT_EMBEDS = {
+    "reset": _NON_NEGATIVE_AMOUNT_EMBED,
+    "set": _NON_NEGATIVE_AMOUNT_EMBED,
+    "add": discord.Embed(
+        title=":warning: Invalid amount",
+        description="Please provide a positive amount to add.",
+        color=0xF1C40F,
+    ),
+    "remove": discord.Embed(
+        title=":warning: Invalid amount",
+        description="Please provide a positive amount to remove.",
+        color=0xF1C40F,
+    ),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _role_balance_title(role_name: str) -> str:
+    suffix = "'" if role_name.endswith("s") else "'s"
+    return f"{role_name}{suffix} balance"
+
 
 class LeaderboardView(discord.ui.View):
     def __init__(
@@ -33,7 +121,9 @@ class LeaderboardView(discord.ui.View):
         make_embed,
     ):
         super().__init__(timeout=180)
+        # May arrive unsorted; sorted by balance on the first page change.
         self.entries = entries
+        self._sorted = False
         self.page_size = page_size
         self.page = 0
         self.invoker_id = invoker_id
@@ -55,20 +145,16 @@ class LeaderboardView(discord.ui.View):
                     child.disabled = self.page >= total - 1
 
     def _slice_entries(self) -> list[tuple[str, int, int]]:
+        if not self._sorted:
+            self.entries.sort(key=BALANCE_KEY, reverse=True)
+            self._sorted = True
         start = self.page * self.page_size
         end = start + self.page_size
         return self.entries[start:end]
 
     async def _ensure_invoker(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.invoker_id:
-            await interaction.response.send_message(
-                embed=discord.Embed(
-                    title=":no_entry: Not allowed",
-                    description="Only the command invoker can use these buttons.",
-                    color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
+            await interaction.response.send_message(embed=NOT_INVOKER_EMBED, ephemeral=True)
             return False
         return True
 
@@ -96,13 +182,48 @@ class Economy(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.economy_path = Path(self.bot.config.data_dir) / "economy.json"
-        self._lock = asyncio.Lock()
+        self.economy_path = self.bot.config.data_dir / "economy.json"
+        # Balance changes lock only the team roles they touch, so unrelated teams don't queue behind each
+        # other. Idle locks drop out of the weak map on their own.
+        self._role_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._whitelist_lock = asyncio.Lock()
+        self._reload_lock = asyncio.Lock()
+        # Loaded in cog_load and reloaded only when the file changes underneath us. The per-role locks only
+        # keep each other's updates when every command works on this shared object rather than its own copy.
+        self._data = EconomyData(whitelisted_role_ids=[], balances={})
+        self._data_stamp: tuple[int, int, int] | None = None
+        self._whitelist_cache: frozenset[int] | None = None
+        # Bumped on every change to self._data; cached leaderboards from an older version are ignored.
+        self._data_version = 0
+        self._leaderboard_cache: dict[int, tuple[float, int, tuple[tuple[str, int, int], ...]]] = {}
+        # Balances can't be rebuilt from anything else, so these writes are fsynced.
+        self._writer = DebouncedWriter(self.economy_path, lambda: self._data.to_dict(), durable=True)
         self._leaderboard_page_size = 10
 
+    async def cog_load(self) -> None:
+        self._data, self._data_stamp = await asyncio.to_thread(load_economy_stamped, self.economy_path)
+        self._whitelist_cache = None
+
+    async def cog_unload(self) -> None:
+        await self._writer.flush()
+
     # -----------------
     # Helper utilities
     # -----------------
+    def _lock_for(self, role_id: int) -> asyncio.Lock:
+        lock = self._role_locks.get(role_id)
+        if lock is None:
+            lock = self._role_locks[role_id] = asyncio.Lock()
+        return lock
+
+    @contextlib.asynccontextmanager
+    async def _role_locks_held(self, *role_ids: int) -> AsyncIterator[None]:
+        # Always acquire in ascending id order so two transfers in opposite directions can't deadlock.
+        async with contextlib.AsyncExitStack() as stack:
+            for role_id in sorted(set(role_ids)):
+                await stack.enter_async_context(self._lock_for(role_id))
+            yield
+
     def _error_embed(self, title: str, description: str, *, color: int = 0xE74C3C) -> discord.Embed:
         return discord.Embed(title=title, description=description, color=color)
 
@@ -110,44 +231,26 @@ class Economy(commands.Cog):
         return discord.Embed(title=title, description=description, color=color)
 
     def _has_admin_role(self, member: discord.Member) -> bool:
-        expected_roles = getattr(self.bot.config, "admin_role_ids", [])
-        expected_ids = {int(role_id) for role_id in expected_roles}
-        return bool(expected_ids) and any(role.id in expected_ids for role in member.roles)
+        return has_any_role(member, self.bot.config.admin_role_ids)
 
     async def _require_admin(self, interaction: discord.Interaction) -> bool:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
-            embed = self._error_embed(
-                title=":no_entry: Guild only",
-                description="This command can only be used inside a server.",
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=GUILD_ONLY_EMBED, ephemeral=True)
             return False
 
         if not self._has_admin_role(interaction.user):
-            embed = self._error_embed(
-                title=":no_entry: You don't have permission",
-                description="You need an admin role to do that.",
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=NOT_ADMIN_EMBED, ephemeral=True)
             return False
         return True
 
-    def _role_balance_title(self, role: discord.Role) -> str:
-        suffix = "'" if role.name.endswith("s") else "'s"
-        return f"{role.name}{suffix} balance"
-
     def _resolve_member_team_role(
-        self, member: discord.Member, whitelisted_ids: set[int]
+        self, member: discord.Member, whitelisted_ids: AbstractSet[int]
     ) -> tuple[discord.Role | None, discord.Embed | None]:
-        matches = resolve_member_team_roles(member.roles, whitelisted_ids)
-        if len(matches) == 1:
-            return matches[0], None
-        if len(matches) == 0:
-            embed = self._error_embed(
-                title=":no_entry: No team role found",
-                description="You don't have any whitelisted team roles. Please contact an admin to be added.",
-            )
-            return None, embed
+        team_role, matches = resolve_single_team_role(member.roles, whitelisted_ids)
+        if team_role is not None:
+            return team_role, None
+        if not matches:
+            return None, NO_TEAM_ROLE_EMBED
         embed = self._error_embed(
             title=":warning: Multiple team roles detected",
             description="You have multiple whitelisted team roles: "
@@ -177,7 +280,7 @@ class Economy(commands.Cog):
             await interaction.response.send_message(**kwargs)
 
     def _ensure_whitelisted(
-        self, role: discord.Role, whitelisted_ids: set[int]
+        self, role: discord.Role, whitelisted_ids: AbstractSet[int]
     ) -> tuple[bool, discord.Embed | None]:
         if role.id in whitelisted_ids:
             return True, None
@@ -188,27 +291,78 @@ class Economy(commands.Cog):
         )
         return False, embed
 
-    def _load_data(self) -> EconomyData:
-        return load_economy(self.economy_path)
-
-    def _save_data(self, data: EconomyData) -> None:
-        save_economy(self.economy_path, data)
+    async def _load_data(self) -> EconomyData:
+        # Pick up hand edits to economy.json, but never while our own changes are still waiting to be
+        # written; a stat is all it costs when nothing changed.
+        if self._writer.dirty:
+            return self._data
+        stamp = file_stamp(self.economy_path)
+        if stamp == self._data_stamp:
+            return self._data
+        async with self._reload_lock:
+            stamp = file_stamp(self.economy_path)
+            if stamp == self._data_stamp:
+                return self._data
+            if stamp == self._writer.saved_stamp:
+                # Our own write; the in-memory data is already what the file holds.
+                self._data_stamp = stamp
+                return self._data
+            version = self._data_version
+            data, read_stamp = await asyncio.to_thread(load_economy_stamped, self.economy_path)
+            if self._data_version != version or self._writer.dirty:
+                # A command changed the current data while the file was being read. The writer may already
+                # have flushed (clearing dirty), so the version is the reliable signal; keep the newer data.
+                return self._data
+            self._data = data
+            self._data_stamp = read_stamp
+            self._data_version += 1
+            self._whitelist_cache = None
+        return self._data
+
+    async def get_whitelist(self) -> frozenset[int]:
+        # Also read by the other cogs, so they see whitelist edits before the debounced save lands.
+        # Derived from self._data; whitelist add/remove and reloads reset it.
+        data = await self._load_data()
+        whitelist = self._whitelist_cache
+        if whitelist is None:
+            whitelist = self._whitelist_cache = frozenset(get_whitelisted_role_ids(data))
+        return whitelist
+
+    def _persist(self) -> None:
+        self._data_version += 1
+        self._writer.mark_dirty()
+
+    async def _leaderboard_entries(self, guild: discord.Guild) -> list[tuple[str, int, int]]:
+        data = await self._load_data()
+        now = time.monotonic()
+        cached = self._leaderboard_cache.get(guild.id)
+        if cached is not None and cached[1] == self._data_version and now - cached[0] < LEADERBOARD_CACHE_SECONDS:
+            return list(cached[2])
+
+        # load_economy already coerces every stored amount to int.
+        get_role = guild.get_role
+        entries: list[tuple[str, int, int]] = []
+        for role_key, amount in data.balances.items():
+            role_id = int(role_key)
+            role = get_role(role_id)
+            display = role.mention if role else f"Role {role_id}"
+            entries.append((display, amount, role_id))
+        # The view sorts its list in place, so cache an immutable copy.
+        self._leaderboard_cache[guild.id] = (now, self._data_version, tuple(entries))
+        return entries
 
     def _make_leaderboard_embed(
         self, page: int, page_count: int, entries: list[tuple[str, int, int]]
     ) -> discord.Embed:
-        lines: list[str] = []
         rank_offset = page * self._leaderboard_page_size
-        if not entries:
-            lines.append("No balances found.")
-        else:
-            for idx, (display, balance, role_id) in enumerate(entries, start=1):
-                rank = rank_offset + idx
-                lines.append(f"#{rank} {display} — ${balance:,}")
+        description = "\n".join(
+            f"#{rank} {display} — ${balance:,}"
+            for rank, (display, balance, _) in enumerate(entries, start=rank_offset + 1)
+        )
 
         embed = self._success_embed(
             title=":trophy: Leaderboard",
-            description="\n".join(lines),
+            description=description or "No balances found.",
             color=0x2ECC71,
         )
         embed.set_footer(text=f"Page {page + 1} / {page_count}")
@@ -224,11 +378,14 @@ class Economy(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
-        async with self._lock:
-            data = self._load_data()
-            added = add_whitelisted_role(data, role.id)
-            if added:
-                self._save_data(data)
+        # Repeated adds of an already whitelisted role are answered from the cached set without locking.
+        added = False
+        if role.id not in await self.get_whitelist():
+            async with self._whitelist_lock, self._lock_for(role.id):
+                added = add_whitelisted_role(await self._load_data(), role.id)
+                if added:
+                    self._whitelist_cache = None
+                    self._persist()
 
         if added:
             embed = self._success_embed(
@@ -251,11 +408,13 @@ class Economy(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
-        async with self._lock:
-            data = self._load_data()
-            removed = remove_whitelisted_role(data, role.id)
-            if removed:
-                self._save_data(data)
+        removed = False
+        if role.id in await self.get_whitelist():
+            async with self._whitelist_lock, self._lock_for(role.id):
+                removed = remove_whitelisted_role(await self._load_data(), role.id)
+                if removed:
+                    self._whitelist_cache = None
+                    self._persist()
 
         if removed:
             embed = self._success_embed(
@@ -277,19 +436,16 @@ class Economy(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
-        async with self._lock:
-            data = self._load_data()
-            whitelisted_ids = get_whitelisted_role_ids(data)
+        whitelisted_ids = await self.get_whitelist()
 
         if not whitelisted_ids:
-            embed = self._error_embed(
-                title=":information_source: No whitelisted roles",
-                description="No team roles have been whitelisted yet.",
-                color=0x3498DB,
-            )
+            embed = NO_WHITELISTED_ROLES_EMBED
         else:
-            roles = [interaction.guild.get_role(rid) for rid in whitelisted_ids if interaction.guild]
-            mentions = [role.mention for role in roles if role]
+            guild = interaction.guild
+            mentions: list[str] = []
+            if guild is not None:
+                get_role = guild.get_role
+                mentions = [role.mention for role in map(get_role, whitelisted_ids) if role is not None]
             embed = self._success_embed(
                 title=":clipboard: Whitelisted team roles",
                 description="\n".join(mentions) if mentions else "No matching roles found in this server.",
@@ -308,36 +464,21 @@ class Economy(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
-        async with self._lock:
-            data = self._load_data()
-            balances = {int(role_id): amount for role_id, amount in data.balances.items()}
-
         if interaction.guild is None:
-            embed = self._error_embed(
-                title=":no_entry: Guild only",
-                description="This command must be used inside a server.",
-            )
-            await self._send_embed(interaction, embed, ephemeral=True)
+            await self._send_embed(interaction, SERVER_ONLY_EMBED, ephemeral=True)
             return
 
-        entries: list[tuple[str, int, int]] = []
-        for role_id, amount in balances.items():
-            if amount is None:
-                continue
-            role = interaction.guild.get_role(role_id)
-            display = role.mention if role else f"Role {role_id}"
-            entries.append((display, int(amount), role_id))
-
-        entries.sort(key=lambda item: item[1], reverse=True)
+        entries = await self._leaderboard_entries(interaction.guild)
 
+        # Only the first page is shown up front; the view sorts the full list if someone pages past it.
         page_count = max(1, (len(entries) + self._leaderboard_page_size - 1) // self._leaderboard_page_size)
-        initial_entries = entries[: self._leaderboard_page_size]
+        initial_entries = heapq.nlargest(self._leaderboard_page_size, entries, key=BALANCE_KEY)
         embed = self._make_leaderboard_embed(0, page_count, initial_entries)
         view = LeaderboardView(
             entries=entries,
             page_size=self._leaderboard_page_size,
             invoker_id=interaction.user.id,
-            make_embed=lambda page, total, slice_entries: self._make_leaderboard_embed(page, total, slice_entries),
+            make_embed=self._make_leaderboard_embed,
         )
         await self._send_embed(interaction, embed, ephemeral=True, view=view)
 
@@ -346,24 +487,15 @@ class Economy(commands.Cog):
     @app_commands.guild_only()
     async def balance(self, interaction: discord.Interaction, team_role: discord.Role | None = None) -> None:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
-            embed = self._error_embed(
-                title=":no_entry: Guild only",
-                description="This command must be used inside a server.",
-            )
-            await self._send_embed(interaction, embed, ephemeral=True)
+            await self._send_embed(interaction, SERVER_ONLY_EMBED, ephemeral=True)
             return
 
-        async with self._lock:
-            data = self._load_data()
-            whitelisted_ids = get_whitelisted_role_ids(data)
+        whitelisted_ids = await self.get_whitelist()
+        data = await self._load_data()
 
         if team_role is not None:
             if not self._has_admin_role(interaction.user):
-                embed = self._error_embed(
-                    title=":no_entry: You don't have permission",
-                    description="You need an admin role to view other teams.",
-                )
-                await self._send_embed(interaction, embed, ephemeral=True)
+                await self._send_embed(interaction, NOT_ADMIN_OTHER_TEAMS_EMBED, ephemeral=True)
                 return
 
             allowed, embed_error = self._ensure_whitelisted(team_role, whitelisted_ids)
@@ -372,7 +504,7 @@ class Economy(commands.Cog):
                 return
 
             balance_value = get_balance(data, team_role.id)
-            title = self._role_balance_title(team_role)
+            title = _role_balance_title(team_role.name)
             embed = discord.Embed(
                 title=title,
                 description=f"Current Balance: **${balance_value}**",
@@ -382,13 +514,12 @@ class Economy(commands.Cog):
             return
 
         team_role_resolved, error_embed = self._resolve_member_team_role(interaction.user, whitelisted_ids)
-        if team_role_resolved is None and error_embed:
+        if team_role_resolved is None:
             await self._send_embed(interaction, error_embed, ephemeral=True)
             return
 
-        assert team_role_resolved is not None
         balance_value = get_balance(data, team_role_resolved.id)
-        title = self._role_balance_title(team_role_resolved)
+        title = _role_balance_title(team_role_resolved.name)
         embed = discord.Embed(
             title=title,
             description=f"Current Balance: **${balance_value}**",
@@ -401,67 +532,54 @@ class Economy(commands.Cog):
     @app_commands.guild_only()
     async def pay(self, interaction: discord.Interaction, amount: int, team_role: discord.Role) -> None:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
-            embed = self._error_embed(
-                title=":no_entry: Guild only",
-                description="This command must be used inside a server.",
-            )
-            await self._send_embed(interaction, embed, ephemeral=True)
+            await self._send_embed(interaction, SERVER_ONLY_EMBED, ephemeral=True)
             return
 
         if amount <= 0:
-            embed = self._error_embed(
-                title=":warning: Invalid amount",
-                description="Please provide a positive amount to transfer.",
-                color=0xF1C40F,
-            )
-            await self._send_embed(interaction, embed, ephemeral=True)
+            await self._send_embed(interaction, INVALID_TRANSFER_AMOUNT_EMBED, ephemeral=True)
             return
 
-        async with self._lock:
-            data = self._load_data()
-            whitelisted_ids = get_whitelisted_role_ids(data)
+        whitelisted_ids = await self.get_whitelist()
+        payer_role, error_embed = self._resolve_member_team_role(interaction.user, whitelisted_ids)
+        if payer_role is None:
+            await self._send_embed(interaction, error_embed)
+            return
 
-            payer_role, error_embed = self._resolve_member_team_role(interaction.user, whitelisted_ids)
-            if payer_role is None:
-                embed_to_send = error_embed
-            else:
-                allowed, not_whitelisted_embed = self._ensure_whitelisted(team_role, whitelisted_ids)
+        allowed, not_whitelisted_embed = self._ensure_whitelisted(team_role, whitelisted_ids)
+        if not allowed:
+            await self._send_embed(interaction, not_whitelisted_embed)
+            return
+
+        error_embed = None
+        async with self._role_locks_held(payer_role.id, team_role.id):
+            # A /whitelist remove may have run while we waited for the locks; it drops the role's balance,
+            # so re-check both sides before moving any money.
+            whitelisted_ids = await self.get_whitelist()
+            for role in (payer_role, team_role):
+                allowed, not_whitelisted_embed = self._ensure_whitelisted(role, whitelisted_ids)
                 if not allowed:
-                    embed_to_send = not_whitelisted_embed
+                    error_embed = not_whitelisted_embed
+                    break
+            else:
+                if transfer_balance(await self._load_data(), payer_role.id, team_role.id, amount) is None:
+                    error_embed = INSUFFICIENT_TRANSFER_FUNDS_EMBED
                 else:
-                    payer_balance = get_balance(data, payer_role.id)
-                    if payer_balance < amount:
-                        embed_to_send = self._error_embed(
-                            title=":no_entry: Insufficient funds",
-                            description="Your team role does not have enough funds for this transfer.",
-                        )
-                    else:
-                        set_balance(data, payer_role.id, payer_balance - amount)
-                        recipient_balance = get_balance(data, team_role.id) + amount
-                        set_balance(data, team_role.id, recipient_balance)
-                        self._save_data(data)
-                        embed_to_send = self._success_embed(
-                            title=":handshake: Transaction Complete!",
-                            description=f"Transferred **${amount}** to <@&{team_role.id}>",
-                            color=team_role.color,
-                        )
-
-        if embed_to_send is None:
-            logger.error("Unexpected missing embed in pay command")
+                    self._persist()
+
+        if error_embed is not None:
+            await self._send_embed(interaction, error_embed)
             return
 
-        await self._send_embed(interaction, embed_to_send)
+        embed = self._success_embed(
+            title=":handshake: Transaction Complete!",
+            description=f"Transferred **${amount}** to <@&{team_role.id}>",
+            color=team_role.color,
+        )
+        await self._send_embed(interaction, embed)
 
     # -----------------
     # Admin balance management
     # -----------------
-    def _invalid_amount_embed(self, message: str) -> discord.Embed:
-        return self._error_embed(
-            title=":warning: Invalid amount",
-            description=message,
-            color=0xF1C40F,
-        )
-
     async def _handle_balance_change(
         self,
         interaction: discord.Interaction,
@@ -474,54 +592,43 @@ class Economy(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
-        async with self._lock:
-            data = self._load_data()
-            whitelisted_ids = get_whitelisted_role_ids(data)
-            allowed, embed_error = self._ensure_whitelisted(team_role, whitelisted_ids)
-            if not allowed:
-                assert embed_error is not None
-                await self._send_embed(interaction, embed_error, ephemeral=False)
-                return
+        # Input checks don't need the data, so bad amounts are rejected before touching the role lock.
+        invalid_amount_embed = INVALID_AMOUNT_EMBEDS.get(operation)
+        if invalid_amount_embed is None:
+            logger.error("Unknown balance operation: %s", operation)
+            return
+        if amount < 0 or (amount == 0 and operation in {"add", "remove"}):
+            await self._send_embed(interaction, invalid_amount_embed, ephemeral=False)
+            return
 
+        # Only the read-modify-write runs under the role lock; every reply is sent after it is released.
+        error_embed: discord.Embed | None = None
+        async with self._lock_for(team_role.id):
+            whitelisted_ids = await self.get_whitelist()
+            data = await self._load_data()
+            allowed, embed_error = self._ensure_whitelisted(team_role, whitelisted_ids)
             old_balance = get_balance(data, team_role.id)
+            new_balance = old_balance
 
-            if operation == "reset":
-                if amount < 0:
-                    embed = self._invalid_amount_embed("Amount must be greater than or equal to zero.")
-                    await self._send_embed(interaction, embed, ephemeral=False)
-                    return
-                new_balance = amount
-            elif operation == "set":
-                if amount < 0:
-                    embed = self._invalid_amount_embed("Amount must be greater than or equal to zero.")
-                    await self._send_embed(interaction, embed, ephemeral=False)
-                    return
-                new_balance = amount
+            if not allowed:
+                error_embed = embed_error
             elif operation == "add":
-                if amount <= 0:
-                    embed = self._invalid_amount_embed("Please provide a positive amount to add.")
-                    await self._send_embed(interaction, embed, ephemeral=False)
-                    return
                 new_balance = old_balance + amount
             elif operation == "remove":
-                if amount <= 0:
-                    embed = self._invalid_amount_embed("Please provide a positive amount to remove.")
-                    await self._send_embed(interaction, embed, ephemeral=False)
-                    return
                 if amount > old_balance:
-                    embed = self._error_embed(
-                        title=":no_entry: Insufficient funds",
-                        description="Insufficient funds to remove that amount.",
-                    )
-                    await self._send_embed(interaction, embed, ephemeral=False)
-                    return
-                new_balance = old_balance - amount
+                    error_embed = INSUFFICIENT_REMOVE_FUNDS_EMBED
+                else:
+                    new_balance = old_balance - amount
             else:
-                logger.error("Unknown balance operation: %s", operation)
-                return
+                new_balance = amount
 
-            set_balance(data, team_role.id, new_balance)
-            self._save_data(data)
+            if error_embed is None:
+                set_balance(data, team_role.id, new_balance)
+                self._persist()
+
+        if error_embed is not None:
+            await self._send_embed(interaction, error_embed, ephemeral=False)
+            return
 
         delta = new_balance - old_balance
         if operation in {"reset", "set"}:
@@ -4,15 +4,19 @@ import asyncio
 import logging
 import re
 import time
-from pathlib import Path
+import weakref
+from collections import OrderedDict
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.economy_store import get_whitelisted_role_ids, load_economy, resolve_member_team_roles
-from bot.teleport_store import TeleportPing, TeleportTrigger, load_teleport, save_teleport
+from bot.checks import has_any_role
+from bot.economy_store import fetch_whitelisted_role_ids, resolve_single_team_role
+from bot.json_store import DebouncedWriter
+from bot.teleport_store import PingIndex, TeleportPing, TeleportTrigger, dump_teleport, load_teleport
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,13 @@ READ_ONLY_OVERWRITE = discord.PermissionOverwrite(
 TANGO_PREFIX = "?tango-"
 TANGO_ALLOWED = set("ABCDEFGHIJKL")
 TANGO_ANSWER = "CFJHAELIBGDK"
+_TRIGGER_RE = re.compile(r"[a-z0-9_-]+")
+_FIRST_WORD_RE = re.compile(r"\?\s*(\S*)")
+TELEPORT_COOLDOWN_SECONDS = 2.0
+DEBOUNCE_MAX_ENTRIES = 1024
+# Concurrent Discord requests per cleanup; discord.py's rate limiter queues the rest.
+CLEANUP_CONCURRENCY = 5
+PING_TIMESTAMP = attrgetter("timestamp")
 
 
 class Teleport(commands.Cog):
@@ -37,11 +48,29 @@ class Teleport(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.teleport_path = Path(self.bot.config.data_dir) / "teleport.json"
-        self.economy_path = Path(self.bot.config.data_dir) / "economy.json"
+        self.teleport_path = self.bot.config.data_dir / "teleport.json"
+        self.economy_path = self.bot.config.data_dir / "economy.json"
         self._lock = asyncio.Lock()
-        self._debounce: Dict[Tuple[int, int, str], float] = {}
-        self._active_locks: Dict[Tuple[int, int], asyncio.Lock] = {}
+        # (guild, team, trigger) -> monotonic time the trigger may next fire,
+        # kept in LRU order and capped at DEBOUNCE_MAX_ENTRIES.
+        self._debounce: OrderedDict[Tuple[int, int, str], float] = OrderedDict()
+        # Entries vanish once no task holds or waits on the lock.
+        self._active_locks: weakref.WeakValueDictionary[Tuple[int, int], asyncio.Lock] = weakref.WeakValueDictionary()
+        self._cleanup_sem = asyncio.Semaphore(CLEANUP_CONCURRENCY)
+        # Loaded once in cog_load; mutations are written behind by self._writer.
+        self._data: dict = {"triggers": {}, "pings_by_team": {}}
+        # Newest ping per (guild, team), maintained by _set_team_pings and _add_ping.
+        self._latest_pings: Dict[Tuple[int, int], TeleportPing] = {}
+        self._writer = DebouncedWriter(self.teleport_path, lambda: dump_teleport(self._data), delay=0.25)
+
+    async def cog_load(self) -> None:
+        self._data = await asyncio.to_thread(load_teleport, self.teleport_path)
+        self._latest_pings = {
+            key: max(pings, key=PING_TIMESTAMP) for key, pings in self._data["pings_by_team"].items() if pings
+        }
+
+    async def cog_unload(self) -> None:
+        await self._writer.flush()
 
     # -----------------
     # Helpers
@@ -53,9 +82,7 @@ class Teleport(commands.Cog):
         return discord.Embed(title=title, description=description, color=color)
 
     def _has_admin_role(self, member: discord.Member) -> bool:
-        expected_roles = getattr(self.bot.config, "admin_role_ids", [])
-        expected_ids = {int(role_id) for role_id in expected_roles}
-        return bool(expected_ids) and any(role.id in expected_ids for role in member.roles)
+        return has_any_role(member, self.bot.config.admin_role_ids)
 
     async def _require_admin(self, interaction: discord.Interaction) -> bool:
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
@@ -76,12 +103,12 @@ class Teleport(commands.Cog):
         return True
 
     def _resolve_member_team_role(
-        self, member: discord.Member, whitelisted_ids: set[int]
+        self, member: discord.Member, whitelisted_ids: frozenset[int]
     ) -> tuple[discord.Role | None, discord.Embed | None]:
-        matches = resolve_member_team_roles(member.roles, whitelisted_ids)
-        if len(matches) == 1:
-            return matches[0], None
-        if len(matches) == 0:
+        team_role, matches = resolve_single_team_role(member.roles, whitelisted_ids)
+        if team_role is not None:
+            return team_role, None
+        if not matches:
             embed = self._error_embed(
                 title=":no_entry: No team role found",
                 description="You don't have any whitelisted team roles. Please contact an admin to be added.",
@@ -96,15 +123,18 @@ class Teleport(commands.Cog):
         )
         return None, embed
 
-    def _load_whitelisted_role_ids(self) -> set[int]:
-        data = load_economy(self.economy_path)
-        return get_whitelisted_role_ids(data)
+    async def _load_whitelisted_role_ids(self) -> frozenset[int]:
+        # Prefer the Economy cog's in-memory whitelist; fall back to economy.json when it isn't loaded.
+        get_whitelist = getattr(self.bot.get_cog("Economy"), "get_whitelist", None)
+        if get_whitelist is not None:
+            return await get_whitelist()
+        return await fetch_whitelisted_role_ids(self.economy_path)
 
     def _load_data(self) -> dict:
-        return load_teleport(self.teleport_path)
+        return self._data
 
-    def _save_data(self, data: dict) -> None:
-        save_teleport(self.teleport_path, data)
+    def _persist(self) -> None:
+        self._writer.mark_dirty()
 
     def _validate_trigger(self, trigger: str) -> tuple[str | None, discord.Embed | None]:
         normalized = trigger.strip().lower()
@@ -115,60 +145,108 @@ class Teleport(commands.Cog):
                 title=":warning: Invalid trigger",
                 description="Trigger cannot be empty.",
             )
-        if not re.fullmatch(r"[a-z0-9-_]+", normalized):
+        if not _TRIGGER_RE.fullmatch(normalized):
             return None, self._error_embed(
                 title=":warning: Invalid trigger",
                 description="Use only letters, numbers, hyphens, or underscores.",
             )
         return normalized, None
 
+    def _already_there_channel(
+        self, guild: discord.Guild, team_role: discord.Role, trigger: TeleportTrigger
+    ) -> Optional[discord.TextChannel]:
+        most_recent = self._most_recent_ping(guild.id, team_role.id)
+        if most_recent is None or most_recent.channel_id != trigger.target_channel_id:
+            return None
+        channel = guild.get_channel(trigger.target_channel_id)
+        if isinstance(channel, discord.TextChannel) and channel.permissions_for(team_role).view_channel:
+            return channel
+        return None
+
+    def _already_there_embed(self, channel: discord.TextChannel) -> discord.Embed:
+        return self._error_embed(
+            title=":information_source: You are already there.",
+            description=f"You already have access to {channel.mention}.",
+            color=0x3498DB,
+        )
+
+    def _mark_debounced(self, key: Tuple[int, int, str]) -> None:
+        self._debounce[key] = time.monotonic() + TELEPORT_COOLDOWN_SECONDS
+        self._debounce.move_to_end(key)
+        while len(self._debounce) > DEBOUNCE_MAX_ENTRIES:
+            self._debounce.popitem(last=False)
+
     def _get_team_lock(self, guild_id: int, team_role_id: int) -> asyncio.Lock:
         key = (guild_id, team_role_id)
-        if key not in self._active_locks:
-            self._active_locks[key] = asyncio.Lock()
-        return self._active_locks[key]
+        lock = self._active_locks.get(key)
+        if lock is None:
+            lock = self._active_locks[key] = asyncio.Lock()
+        return lock
 
     def _team_role_from_id(self, guild: discord.Guild, team_role_id: int) -> Optional[discord.Role]:
         return guild.get_role(team_role_id)
 
-    def _most_recent_ping(self, pings: List[TeleportPing], guild_id: int, team_role_id: int) -> Optional[TeleportPing]:
-        matches = [ping for ping in pings if ping.guild_id == guild_id and ping.team_role_id == team_role_id]
-        if not matches:
-            return None
-        return max(matches, key=lambda p: p.timestamp)
+    def _team_pings(self, guild_id: int, team_role_id: int) -> List[TeleportPing]:
+        pings_by_team: PingIndex = self._load_data()["pings_by_team"]
+        return pings_by_team.get((guild_id, team_role_id), [])
+
+    def _set_team_pings(self, guild_id: int, team_role_id: int, pings: List[TeleportPing]) -> None:
+        pings_by_team: PingIndex = self._load_data()["pings_by_team"]
+        key = (guild_id, team_role_id)
+        if pings:
+            pings_by_team[key] = pings
+            self._latest_pings[key] = max(pings, key=PING_TIMESTAMP)
+        else:
+            pings_by_team.pop(key, None)
+            self._latest_pings.pop(key, None)
+
+    def _add_ping(self, ping: TeleportPing) -> None:
+        pings_by_team: PingIndex = self._load_data()["pings_by_team"]
+        key = (ping.guild_id, ping.team_role_id)
+        pings_by_team.setdefault(key, []).append(ping)
+        self._latest_pings[key] = ping
+
+    def _most_recent_ping(self, guild_id: int, team_role_id: int) -> Optional[TeleportPing]:
+        return self._latest_pings.get((guild_id, team_role_id))
 
     async def _delete_ping_records(
         self,
         guild: discord.Guild,
+        team_role: discord.Role,
         pings: List[TeleportPing],
         *,
         keep_channel_ids: set[int],
-        team_role_id: int,
     ) -> List[TeleportPing]:
+        # pings is team_role's bucket from _team_pings.
         remaining: List[TeleportPing] = []
+        stale: List[TeleportPing] = []
         for ping in pings:
-            if ping.guild_id != guild.id or ping.team_role_id != team_role_id:
-                remaining.append(ping)
-                continue
             if keep_channel_ids and ping.channel_id in keep_channel_ids:
                 remaining.append(ping)
-                continue
+            else:
+                stale.append(ping)
+        await self._clear_pings(guild, team_role, stale)
+        return remaining
+
+    async def _clear_pings(self, guild: discord.Guild, team_role: discord.Role, pings: List[TeleportPing]) -> None:
+        if pings:
+            await asyncio.gather(*(self._clear_ping(guild, team_role, ping) for ping in pings))
 
-            channel = guild.get_channel(ping.channel_id)
-            role = guild.get_role(ping.team_role_id)
-            if isinstance(channel, (discord.TextChannel, discord.Thread, discord.VoiceChannel)) and role:
+    async def _clear_ping(self, guild: discord.Guild, team_role: discord.Role, ping: TeleportPing) -> None:
+        channel = guild.get_channel(ping.channel_id)
+        if not isinstance(channel, (discord.TextChannel, discord.Thread, discord.VoiceChannel)):
+            return
+        async with self._cleanup_sem:
+            try:
+                await channel.set_permissions(team_role, overwrite=None)
+            except Exception:
+                logger.warning("Failed clearing permissions for role %s in %s", ping.team_role_id, ping.channel_id)
+            if isinstance(channel, (discord.TextChannel, discord.Thread)):
                 try:
-                    await channel.set_permissions(role, overwrite=None)
+                    message = await channel.fetch_message(ping.message_id)
+                    await message.delete()
                 except Exception:
-                    logger.warning("Failed clearing permissions for role %s in %s", ping.team_role_id, ping.channel_id)
-                if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                    try:
-                        message = await channel.fetch_message(ping.message_id)
-                        await message.delete()
-                    except Exception:
-                        logger.debug("Ping message %s already gone in channel %s", ping.message_id, ping.channel_id)
-            # do not keep this ping
-        return remaining
+                    logger.debug("Ping message %s already gone in channel %s", ping.message_id, ping.channel_id)
 
     async def _grant_channel_access(
         self, channel: discord.TextChannel, role: discord.Role
@@ -231,7 +309,7 @@ class Teleport(commands.Cog):
                 parent_channel_id=parent.id if parent else None,
             )
             data["triggers"] = triggers
-            self._save_data(data)
+            self._persist()
 
         embed = self._success_embed(
             title=":white_check_mark: Teleport added",
@@ -266,7 +344,7 @@ class Teleport(commands.Cog):
 
             triggers.pop(normalized, None)
             data["triggers"] = triggers
-            self._save_data(data)
+            self._persist()
 
         embed = self._success_embed(
             title=":white_check_mark: Teleport removed",
@@ -292,27 +370,25 @@ class Teleport(commands.Cog):
             await self._handle_routeinfo(message)
             return
 
-        parts = content[1:].split()
-        if not parts:
+        # Only the first word matters; don't split the whole message to get it.
+        key = _FIRST_WORD_RE.match(content).group(1).lower()
+        if not key:
             return
-        key = parts[0].strip().lower()
 
-        async with self._lock:
-            data = self._load_data()
-        triggers: Dict[str, TeleportTrigger] = data.get("triggers", {})
-        if key not in triggers:
+        # Most ?-messages are ordinary chatter: reject them with a dict lookup
+        # before resolving roles or taking any lock.
+        trigger = self._load_data()["triggers"].get(key)
+        if trigger is None:
             return
 
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, error_embed = self._resolve_member_team_role(message.author, whitelisted_ids)
         if team_role is None or error_embed is not None:
             await message.channel.send(embed=error_embed)
             return
 
-        now = time.monotonic()
         debounce_key = (message.guild.id, team_role.id, key)
-        last_used = self._debounce.get(debounce_key, 0)
-        if now - last_used < 2:
+        if time.monotonic() < self._debounce.get(debounce_key, 0.0):
             embed = self._error_embed(
                 title=":warning: Slow down.",
                 description="Please wait a moment before triggering this teleport again.",
@@ -321,10 +397,18 @@ class Teleport(commands.Cog):
             await message.channel.send(embed=embed)
             return
 
+        # Repeat triggers after a move are common and change nothing, so answer
+        # them from memory without queueing behind the team's lock.
+        current_channel = self._already_there_channel(message.guild, team_role, trigger)
+        if current_channel is not None:
+            await message.channel.send(embed=self._already_there_embed(current_channel))
+            self._mark_debounced(debounce_key)
+            return
+
         lock = self._get_team_lock(message.guild.id, team_role.id)
         async with lock:
-            await self._handle_teleport(message, team_role, triggers[key])
-            self._debounce[debounce_key] = time.monotonic()
+            await self._handle_teleport(message, team_role, trigger)
+            self._mark_debounced(debounce_key)
 
     async def _handle_tango(self, message: discord.Message, content: str) -> None:
         if not isinstance(message.author, discord.Member):
@@ -354,32 +438,17 @@ class Teleport(commands.Cog):
         if message.guild is None or not isinstance(message.author, discord.Member):
             return
 
-        whitelisted_ids = self._load_whitelisted_role_ids()
+        whitelisted_ids = await self._load_whitelisted_role_ids()
         team_role, _ = self._resolve_member_team_role(message.author, whitelisted_ids)
         if team_role is None:
             return
 
         async with self._lock:
-            data = self._load_data()
-            pings: List[TeleportPing] = data.get("pings", [])
-            remaining = [ping for ping in pings if not (ping.guild_id == message.guild.id and ping.team_role_id == team_role.id)]
-            removal_targets = [ping for ping in pings if ping.guild_id == message.guild.id and ping.team_role_id == team_role.id]
-            data["pings"] = remaining
-            self._save_data(data)
-
-        for ping in removal_targets:
-            channel = message.guild.get_channel(ping.channel_id)
-            if isinstance(channel, (discord.TextChannel, discord.Thread, discord.VoiceChannel)):
-                try:
-                    await channel.set_permissions(team_role, overwrite=None)
-                except Exception:
-                    logger.debug("Failed to clear permissions during routeinfo cleanup for %s", team_role.id)
-                if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                    try:
-                        msg = await channel.fetch_message(ping.message_id)
-                        await msg.delete()
-                    except Exception:
-                        logger.debug("Ping message already removed during routeinfo cleanup")
+            removal_targets = self._team_pings(message.guild.id, team_role.id)
+            self._set_team_pings(message.guild.id, team_role.id, [])
+            self._persist()
+
+        await self._clear_pings(message.guild, team_role, removal_targets)
 
     async def _handle_teleport(
         self, message: discord.Message, team_role: discord.Role, trigger: TeleportTrigger
@@ -388,11 +457,6 @@ class Teleport(commands.Cog):
         if guild is None:
             return
 
-        async with self._lock:
-            data = self._load_data()
-            pings: List[TeleportPing] = data.get("pings", [])
-
-        most_recent = self._most_recent_ping(pings, guild.id, team_role.id)
         target_channel = guild.get_channel(trigger.target_channel_id)
         parent_channel_id = trigger.parent_channel_id
         if not isinstance(target_channel, discord.TextChannel):
@@ -404,36 +468,35 @@ class Teleport(commands.Cog):
             await message.channel.send(embed=embed)
             return
 
-        if most_recent and most_recent.channel_id == target_channel.id:
-            perms = target_channel.permissions_for(team_role)
-            if perms.view_channel:
-                embed = self._error_embed(
-                    title=":information_source: You are already there.",
-                    description=f"You already have access to {target_channel.mention}.",
-                    color=0x3498DB,
-                )
-                await message.channel.send(embed=embed)
-                return
+        # on_message already answered this without the lock; check again now
+        # that we hold it, in case a queued teleport just moved the team here.
+        # Plain in-memory read, so no other task can change the index under us.
+        if self._already_there_channel(guild, team_role, trigger) is not None:
+            await message.channel.send(embed=self._already_there_embed(target_channel))
+            return
 
         keep_channels: set[int] = set()
         if parent_channel_id:
             keep_channels.add(parent_channel_id)
 
         async with self._lock:
-            data = self._load_data()
-            current_pings: List[TeleportPing] = data.get("pings", [])
+            current_pings = self._team_pings(guild.id, team_role.id)
             cleaned = await self._delete_ping_records(
-                guild, current_pings, keep_channel_ids=keep_channels, team_role_id=team_role.id
+                guild, team_role, current_pings, keep_channel_ids=keep_channels
             )
-            data["pings"] = cleaned
-            self._save_data(data)
+            self._set_team_pings(guild.id, team_role.id, cleaned)
+            self._persist()
 
+        # The two grants are independent; only the ping has to wait for the
+        # target channel's overwrite so the mention reaches the team.
+        grants = []
         if parent_channel_id:
             parent_channel = guild.get_channel(parent_channel_id)
             if isinstance(parent_channel, discord.TextChannel):
-                await self._grant_channel_access(parent_channel, team_role)
+                grants.append(self._grant_channel_access(parent_channel, team_role))
+        grants.append(self._grant_channel_access(target_channel, team_role))
+        await asyncio.gather(*grants)
 
-        await self._grant_channel_access(target_channel, team_role)
         ping_message_id = await self._send_ping(target_channel, team_role, trigger.trigger)
 
         if ping_message_id is not None:
@@ -446,11 +509,8 @@ class Teleport(commands.Cog):
                 timestamp=time.time(),
             )
             async with self._lock:
-                data = self._load_data()
-                pings: List[TeleportPing] = data.get("pings", [])
-                pings.append(new_ping)
-                data["pings"] = pings
-                self._save_data(data)
+                self._add_ping(new_ping)
+                self._persist()
 
         await message.channel.send(
             embed=self._success_embed(
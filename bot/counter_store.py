@@ -3,23 +3,46 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict
 
-from bot.json_store import load_json, save_json
+from bot.json_store import DebouncedWriter, load_json
 
 COUNTER_FILENAME = "counters.json"
 
+# Counters are kept in memory per file and written back in batches; the core
+# cog flushes any pending write on unload via flush_counters().
+_counters: Dict[Path, Dict[str, int]] = {}
+_writers: Dict[Path, DebouncedWriter] = {}
 
-def _load_counters(path: Path) -> Dict[str, int]:
-    return load_json(path, {})
+
+def load_counters(path: Path) -> Dict[str, int]:
+    counters = _counters.get(path)
+    if counters is None:
+        counters = load_json(path, {})
+        _counters[path] = counters
+    return counters
+
+
+def _writer_for(path: Path, counters: Dict[str, int]) -> DebouncedWriter:
+    writer = _writers.get(path)
+    if writer is None:
+        writer = DebouncedWriter(path, lambda: dict(counters), delay=1.0)
+        _writers[path] = writer
+    return writer
 
 
 def increment_counter(path: Path, guild_id: int) -> int:
-    counters = _load_counters(path)
+    counters = load_counters(path)
     key = str(guild_id)
-    counters[key] = counters.get(key, 0) + 1
-    save_json(path, counters)
-    return counters[key]
+    value = counters.get(key, 0) + 1
+    counters[key] = value
+    _writer_for(path, counters).mark_dirty()
+    return value
 
 
 def get_counter(path: Path, guild_id: int) -> int:
-    counters = _load_counters(path)
+    counters = load_counters(path)
     return counters.get(str(guild_id), 0)
+
+
+async def flush_counters() -> None:
+    for writer in list(_writers.values()):
+        await writer.flush()
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
 import discord
 
-from bot.json_store import load_json, save_json
+from bot.json_store import file_stamp, load_json_stamped
 
 
 def _default_data() -> Dict[str, object]:
@@ -19,24 +20,53 @@ class EconomyData:
     balances: Dict[str, int]
 
     def to_dict(self) -> Dict[str, object]:
-        return {"whitelisted_role_ids": self.whitelisted_role_ids, "balances": self.balances}
+        # Copies, so the payload can be serialised off the event loop while commands keep mutating.
+        return {"whitelisted_role_ids": list(self.whitelisted_role_ids), "balances": dict(self.balances)}
 
 
 def load_economy(path: Path) -> EconomyData:
-    raw = load_json(path, _default_data()) or _default_data()
-    whitelisted = [str(role_id) for role_id in raw.get("whitelisted_role_ids", [])]
-    balances = {str(role_id): int(amount) for role_id, amount in (raw.get("balances") or {}).items()}
-    return EconomyData(whitelisted_role_ids=whitelisted, balances=balances)
+    return load_economy_stamped(path)[0]
 
 
-def save_economy(path: Path, data: EconomyData) -> None:
-    save_json(path, data.to_dict())
+def load_economy_stamped(path: Path) -> Tuple[EconomyData, Tuple[int, int, int]]:
+    """Load ``path`` and return the data together with the :func:`~bot.json_store.file_stamp` it was read at."""
+    raw, stamp = load_json_stamped(path, _default_data())
+    raw = raw or _default_data()
+    whitelisted = [str(role_id) for role_id in raw.get("whitelisted_role_ids", [])]
+    balances = {str(role_id): int(amount) for role_id, amount in (raw.get("balances") or {}).items()}
+    return EconomyData(whitelisted_role_ids=whitelisted, balances=balances), stamp
 
 
 def get_whitelisted_role_ids(data: EconomyData) -> Set[int]:
     return {int(role_id) for role_id in data.whitelisted_role_ids}
 
 
+_whitelist_cache: Dict[Path, Tuple[Tuple[int, int, int], FrozenSet[int]]] = {}
+
+
+def load_whitelisted_role_ids(path: Path) -> FrozenSet[int]:
+    """Return the whitelisted role ids stored at ``path``.
+
+    The parsed set is cached per path and only re-read when the file's inode, mtime or size changes,
+    so read-only callers can use this on every command without re-parsing the JSON.
+    """
+    cached = _whitelist_cache.get(path)
+    if cached is not None and cached[0] == file_stamp(path):
+        return cached[1]
+    data, stamp = load_economy_stamped(path)
+    role_ids = frozenset(get_whitelisted_role_ids(data))
+    _whitelist_cache[path] = (stamp, role_ids)
+    return role_ids
+
+
+async def fetch_whitelisted_role_ids(path: Path) -> FrozenSet[int]:
+    """Async :func:`load_whitelisted_role_ids`: a cache hit returns inline, a miss parses off the event loop."""
+    cached = _whitelist_cache.get(path)
+    if cached is not None and cached[0] == file_stamp(path):
+        return cached[1]
+    return await asyncio.to_thread(load_whitelisted_role_ids, path)
+
+
 def add_whitelisted_role(data: EconomyData, role_id: int) -> bool:
     role_key = str(role_id)
     if role_key in data.whitelisted_role_ids:
@@ -63,5 +93,36 @@ def set_balance(data: EconomyData, role_id: int, amount: int) -> None:
     data.balances[str(role_id)] = amount
 
 
-def resolve_member_team_roles(member_roles: List[discord.Role], whitelisted_ids: Set[int]) -> List[discord.Role]:
-    return [role for role in member_roles if getattr(role, "id", None) in whitelisted_ids]
+def transfer_balance(data: EconomyData, payer_id: int, recipient_id: int, amount: int) -> Optional[Tuple[int, int]]:
+    """Move ``amount`` from ``payer_id`` to ``recipient_id`` and return their new balances.
+
+    Returns ``None`` and leaves ``data`` untouched when the payer cannot cover ``amount``.
+    """
+    balances = data.balances
+    payer_key = str(payer_id)
+    payer_balance = balances.get(payer_key, 0)
+    if payer_balance < amount:
+        return None
+    balances[payer_key] = payer_balance - amount
+    recipient_key = str(recipient_id)
+    recipient_balance = balances.get(recipient_key, 0) + amount
+    balances[recipient_key] = recipient_balance
+    # Re-read the payer in case it is also the recipient.
+    return balances[payer_key], recipient_balance
+
+
+def resolve_single_team_role(
+    member_roles: Sequence[discord.Role], whitelisted_ids: AbstractSet[int]
+) -> Tuple[Optional[discord.Role], List[discord.Role]]:
+    """Return ``(role, [])`` when exactly one of ``member_roles`` is whitelisted.
+
+    Otherwise the role is ``None`` and the list holds every whitelisted match (empty when there are none).
+    The common single-match case does not build a list, and a second match stops the scan early.
+    """
+    found: Optional[discord.Role] = None
+    for role in member_roles:
+        if role.id in whitelisted_ids:
+            if found is not None:
+                return None, [match for match in member_roles if match.id in whitelisted_ids]
+            found = role
+    return found, []
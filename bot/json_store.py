@@ -1,33 +1,178 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# save_json runs on worker threads; serialise writers of the same file so two
+# saves can't interleave their os.replace calls and land an older payload last.
+_path_locks: Dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+# Failed DebouncedWriter saves are retried with doubling delays up to this cap.
+MAX_RETRY_DELAY = 30.0
 
 
 def ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+MISSING_STAMP = (-1, -1, -1)
+
+
+def _stamp_of(st: os.stat_result) -> Tuple[int, int, int]:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def file_stamp(path: Path) -> Tuple[int, int, int]:
+    """Return ``(inode, mtime_ns, size)`` for ``path``, or ``(-1, -1, -1)`` when it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return MISSING_STAMP
+    return _stamp_of(st)
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
 def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
+    return load_json_stamped(path, default)[0]
+
+
+def load_json_stamped(path: Path, default: Any) -> Tuple[Any, Tuple[int, int, int]]:
+    """Like :func:`load_json`, but also return the :func:`file_stamp` of the file that was actually read.
+
+    The stamp comes from the open descriptor, so a save that replaces ``path`` mid-read can't pair new
+    metadata with old contents.
+    """
+    try:
+        fp = open(path, "rb")
+    except FileNotFoundError:
         ensure_parent(path)
-        return default
+        return default, MISSING_STAMP
 
-    with path.open("r", encoding="utf-8") as fp:
+    with fp:
+        stamp = _stamp_of(os.fstat(fp.fileno()))
         try:
-            return json.load(fp)
-        except json.JSONDecodeError:
-            return default
-
-
-def save_json(path: Path, obj: Any) -> None:
-    ensure_parent(path)
-    with tempfile.NamedTemporaryFile("w", delete=False, dir=str(path.parent), encoding="utf-8") as tmp:
-        json.dump(obj, tmp, indent=2)
-        tmp.flush()
-        os.fsync(tmp.fileno())
-        temp_name = tmp.name
-    os.replace(temp_name, path)
+            return _loads(fp.read()), stamp
+        except ValueError:
+            return default, stamp
+
+
+def _write_temp(path: Path, data: bytes, durable: bool) -> str:
+    with tempfile.NamedTemporaryFile("wb", delete=False, dir=path.parent) as tmp:
+        tmp.write(data)
+        if durable:
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        return tmp.name
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _path_locks_guard:
+        lock = _path_locks.get(path)
+        if lock is None:
+            lock = _path_locks[path] = threading.Lock()
+        return lock
+
+
+def save_json(path: Path, obj: Any, *, durable: bool = False) -> None:
+    # The rename is always atomic, so a crashed process never leaves a torn file. Without durable=True the
+    # data is not fsynced, and a power loss can roll the file back to an earlier write; pass it for data
+    # that cannot be rebuilt.
+    data = _dumps(obj)
+    with _lock_for(path):
+        try:
+            temp_name = _write_temp(path, data, durable)
+        except FileNotFoundError:
+            # Only create the data directory when it is actually missing.
+            ensure_parent(path)
+            temp_name = _write_temp(path, data, durable)
+        os.replace(temp_name, path)
+
+
+class DebouncedWriter:
+    """Coalesce bursts of changes to ``path`` into a single :func:`save_json` call.
+
+    ``snapshot`` is called on the event loop when the write happens and must return a JSON payload that
+    is not mutated afterwards; the file itself is written from a worker thread. ``saved_stamp`` is the
+    :func:`file_stamp` of the last successful write, so owners can tell their own writes from outside edits.
+    ``durable`` is forwarded to :func:`save_json`. A failed save stays dirty and is retried with backoff.
+    """
+
+    def __init__(
+        self, path: Path, snapshot: Callable[[], Any], *, delay: float = 0.5, durable: bool = False
+    ) -> None:
+        self.path = path
+        self._snapshot = snapshot
+        self._delay = delay
+        self._durable = durable
+        self._retry_delay = delay
+        self._dirty = False
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self.saved_stamp: Optional[Tuple[int, int, int]] = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+        self._schedule(self._delay)
+
+    def _schedule(self, delay: float) -> None:
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._handle = None
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = self._snapshot()
+            try:
+                self.saved_stamp = await asyncio.to_thread(self._save, payload)
+            except Exception:
+                logger.exception("Failed to save %s; retrying in %.1fs", self.path, self._retry_delay)
+                self._dirty = True
+                self._schedule(self._retry_delay)
+                self._retry_delay = min(max(self._retry_delay * 2, 1.0), MAX_RETRY_DELAY)
+            else:
+                self._retry_delay = self._delay
+
+    def _save(self, payload: Any) -> Tuple[int, int, int]:
+        save_json(self.path, payload, durable=self._durable)
+        return file_stamp(self.path)
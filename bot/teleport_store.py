@@ -2,16 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from bot.json_store import load_json, save_json
+from bot.json_store import load_json
+
+# Pings are held in memory grouped by (guild_id, team_role_id) so a teleport
+# only looks at its own team's records; the file keeps the flat "pings" list.
+PingIndex = Dict[Tuple[int, int], List["TeleportPing"]]
 
 
 def _default_data() -> Dict[str, object]:
     return {"triggers": {}, "pings": []}
 
 
-@dataclass
+@dataclass(slots=True)
 class TeleportTrigger:
     trigger: str
     target_channel_id: int
@@ -32,7 +36,7 @@ class TeleportTrigger:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TeleportPing:
     guild_id: int
     team_role_id: int
@@ -75,21 +79,21 @@ def load_teleport(path: Path) -> Dict[str, Any]:
         except Exception:
             continue
 
-    pings: List[TeleportPing] = []
+    pings_by_team: PingIndex = {}
     for record in pings_raw:
         try:
-            pings.append(TeleportPing.from_dict(record))
+            ping = TeleportPing.from_dict(record)
         except Exception:
             continue
+        pings_by_team.setdefault((ping.guild_id, ping.team_role_id), []).append(ping)
 
-    return {"triggers": triggers, "pings": pings}
+    return {"triggers": triggers, "pings_by_team": pings_by_team}
 
 
-def save_teleport(path: Path, data: Dict[str, Any]) -> None:
+def dump_teleport(data: Dict[str, Any]) -> Dict[str, Any]:
     triggers: Dict[str, TeleportTrigger] = data.get("triggers", {})
-    pings: List[TeleportPing] = data.get("pings", [])
-    payload = {
+    pings_by_team: PingIndex = data.get("pings_by_team", {})
+    return {
         "triggers": {key: trigger.to_dict() for key, trigger in triggers.items()},
-        "pings": [ping.to_dict() for ping in pings],
+        "pings": [ping.to_dict() for pings in pings_by_team.values() for ping in pings],
     }
-    save_json(path, payload)
@@ -1,13 +1,20 @@
 import asyncio
 import logging
 
-from bot.client import BotClient
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup, not available on Windows
+    uvloop = None
+
 from bot.config import load_config
 from bot.logging_setup import setup_logging
 
 
 async def main() -> None:
     config = load_config()
+    # Imported only once the config is valid, so a bad config fails before discord.py and the cogs load.
+    from bot.client import BotClient
+
     setup_logging(config.log_level)
     logger = logging.getLogger(__name__)
 
@@ -20,7 +27,15 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        asyncio.run(main())
+        if hasattr(asyncio, "Runner"):
+            # debug=False keeps a stray PYTHONASYNCIODEBUG from enabling slow-callback timing in production.
+            with asyncio.Runner(debug=False, loop_factory=loop_factory) as runner:
+                runner.run(main())
+        elif uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         pass
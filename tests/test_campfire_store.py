@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot import campfire_store
+from bot.campfire_store import CampfireState, load_campfire
+
+
+class LoadCampfireTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "campfire.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, teams: object) -> None:
+        self.path.write_text(json.dumps({"teams": teams}))
+
+    def test_well_formed(self) -> None:
+        self._write({"1": {"fuel_points": 3, "is_camping": True, "channel_id": "5", "started_at": 10}})
+        self.assertEqual(
+            load_campfire(self.path),
+            {1: CampfireState(fuel_points=3, is_camping=True, channel_id=5, started_at=10.0)},
+        )
+
+    def test_malformed_entries_are_skipped(self) -> None:
+        self._write(
+            {
+                "1": {"fuel_points": 3},
+                "not-a-role": {"fuel_points": 1},
+                "2": {"fuel_points": "lots"},
+                "3": None,
+                "4": {},
+            }
+        )
+        with self.assertLogs(campfire_store.logger, "WARNING") as logs:
+            states = load_campfire(self.path)
+
+        self.assertEqual(states, {1: CampfireState(fuel_points=3), 4: CampfireState()})
+        self.assertEqual(len(logs.records), 3)
+
+    def test_missing_file(self) -> None:
+        self.assertEqual(load_campfire(self.path), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+
+from bot.cogs.countdown import _parse_duration_seconds, _seconds_until_next_interval_boundary
+
+# 2024-01-01 05:30:00 UTC, which is on a 15 minute boundary.
+BOUNDARY_TS = 1704087000
+
+
+class ParseDurationSecondsTest(unittest.TestCase):
+    def test_units(self) -> None:
+        self.assertEqual(_parse_duration_seconds("45s"), 45)
+        self.assertEqual(_parse_duration_seconds("10m"), 600)
+        self.assertEqual(_parse_duration_seconds("2h"), 7200)
+        self.assertEqual(_parse_duration_seconds("1h 30m 15s"), 5415)
+        # Spaces are ignored, case is folded and a unit may repeat.
+        self.assertEqual(_parse_duration_seconds(" 1H30M "), 5400)
+        self.assertEqual(_parse_duration_seconds("1m1m"), 120)
+
+    def test_bad_input(self) -> None:
+        for duration in ("", "   ", "10", "m", "10x", "1h30", "-5m", "1.5h", "0m", "0h0m0s", "５m"):
+            with self.subTest(duration=duration):
+                with self.assertRaises(ValueError):
+                    _parse_duration_seconds(duration)
+
+    def test_large_values(self) -> None:
+        # No overflow in Python ints; the MAX_DURATION_SECONDS limit is enforced by the command.
+        self.assertEqual(_parse_duration_seconds("99999999999999999999h"), 99999999999999999999 * 3600)
+
+
+class SecondsUntilNextIntervalBoundaryTest(unittest.TestCase):
+    def test_exact_boundary(self) -> None:
+        self.assertEqual(_seconds_until_next_interval_boundary(BOUNDARY_TS, 15), 0)
+        # UTC midnight is a boundary for every interval.
+        self.assertEqual(_seconds_until_next_interval_boundary(1704067200, 7), 0)
+
+    def test_just_before_boundary(self) -> None:
+        self.assertEqual(_seconds_until_next_interval_boundary(BOUNDARY_TS - 1, 15), 1)
+
+    def test_just_after_boundary(self) -> None:
+        self.assertEqual(_seconds_until_next_interval_boundary(BOUNDARY_TS + 1, 15), 15 * 60 - 1)
+
+    def test_non_positive_interval(self) -> None:
+        self.assertEqual(_seconds_until_next_interval_boundary(BOUNDARY_TS + 1, 0), 0)
+        self.assertEqual(_seconds_until_next_interval_boundary(BOUNDARY_TS + 1, -5), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
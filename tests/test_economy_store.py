@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from bot import economy_store
+from bot.economy_store import (
+    EconomyData,
+    fetch_whitelisted_role_ids,
+    load_whitelisted_role_ids,
+    resolve_single_team_role,
+    transfer_balance,
+)
+from bot.json_store import save_json
+
+
+def _data(balances: dict[str, int]) -> EconomyData:
+    return EconomyData(whitelisted_role_ids=[], balances=dict(balances))
+
+
+class TransferBalanceTest(unittest.TestCase):
+    def test_transfer(self) -> None:
+        data = _data({"1": 10, "2": 5})
+        self.assertEqual(transfer_balance(data, 1, 2, 4), (6, 9))
+        self.assertEqual(data.balances, {"1": 6, "2": 9})
+
+    def test_insufficient_funds_leaves_data_untouched(self) -> None:
+        data = _data({"1": 3, "2": 5})
+        self.assertIsNone(transfer_balance(data, 1, 2, 4))
+        self.assertEqual(data.balances, {"1": 3, "2": 5})
+        # A payer without a balance entry has nothing to spend.
+        self.assertIsNone(transfer_balance(data, 9, 2, 1))
+        self.assertEqual(data.balances, {"1": 3, "2": 5})
+
+    def test_payer_is_recipient(self) -> None:
+        data = _data({"1": 10})
+        self.assertEqual(transfer_balance(data, 1, 1, 4), (10, 10))
+        self.assertEqual(data.balances, {"1": 10})
+
+    def test_unknown_recipient_starts_at_zero(self) -> None:
+        data = _data({"1": 10})
+        self.assertEqual(transfer_balance(data, 1, 2, 10), (0, 10))
+        self.assertEqual(data.balances, {"1": 0, "2": 10})
+
+
+class ResolveSingleTeamRoleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Only ``.id`` is read, so plain namespaces stand in for discord.Role.
+        self.roles = [SimpleNamespace(id=role_id) for role_id in (10, 20, 30, 40)]
+
+    def test_no_match(self) -> None:
+        self.assertEqual(resolve_single_team_role(self.roles, {99}), (None, []))
+        self.assertEqual(resolve_single_team_role([], {10}), (None, []))
+
+    def test_single_match(self) -> None:
+        role, matches = resolve_single_team_role(self.roles, {30, 99})
+        self.assertIs(role, self.roles[2])
+        self.assertEqual(matches, [])
+
+    def test_multiple_matches_keep_member_role_order(self) -> None:
+        role, matches = resolve_single_team_role(self.roles, {40, 10, 30})
+        self.assertIsNone(role)
+        self.assertEqual(matches, [self.roles[0], self.roles[2], self.roles[3]])
+
+
+class WhitelistCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "economy.json"
+        save_json(self.path, {"whitelisted_role_ids": ["1", "2"], "balances": {}})
+        self.loads = mock.patch.object(
+            economy_store, "load_economy_stamped", wraps=economy_store.load_economy_stamped
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    async def asyncTearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_same_stamp_is_a_cache_hit(self) -> None:
+        first = load_whitelisted_role_ids(self.path)
+        self.assertEqual(first, frozenset({1, 2}))
+        self.assertIs(load_whitelisted_role_ids(self.path), first)
+        self.assertIs(await fetch_whitelisted_role_ids(self.path), first)
+        self.assertEqual(self.loads.call_count, 1)
+
+    async def test_rewrite_invalidates(self) -> None:
+        load_whitelisted_role_ids(self.path)
+        save_json(self.path, {"whitelisted_role_ids": ["3"], "balances": {}})
+        self.assertEqual(await fetch_whitelisted_role_ids(self.path), frozenset({3}))
+        self.assertEqual(load_whitelisted_role_ids(self.path), frozenset({3}))
+        self.assertEqual(self.loads.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
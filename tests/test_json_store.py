@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from bot import json_store
+from bot.json_store import DebouncedWriter
+
+
+class DebouncedWriterTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "data.json"
+
+    async def asyncTearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_failed_save_is_retried(self) -> None:
+        data = {"value": 1}
+        writer = DebouncedWriter(self.path, lambda: dict(data), delay=0.01)
+        real_save = json_store.save_json
+        calls = []
+
+        def flaky_save(path: Path, obj: object, *, durable: bool = False) -> None:
+            calls.append(obj)
+            if len(calls) == 1:
+                raise OSError("disk hiccup")
+            real_save(path, obj, durable=durable)
+
+        with mock.patch.object(json_store, "save_json", side_effect=flaky_save), self.assertLogs(
+            json_store.logger, "ERROR"
+        ):
+            writer.mark_dirty()
+            # No further mark_dirty(): the writer has to re-arm itself after the failure.
+            for _ in range(1000):
+                await asyncio.sleep(0.01)
+                if len(calls) >= 2 and not writer.dirty:
+                    break
+
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(writer.dirty)
+        self.assertEqual(json.loads(self.path.read_text()), {"value": 1})
+        self.assertIsNotNone(writer.saved_stamp)
+
+
+if __name__ == "__main__":
+    unittest.main()